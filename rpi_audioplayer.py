@@ -24,7 +24,6 @@ import pygame
 import os
 from pathlib import Path
 from mutagen import File as MutagenFile
-import time
 import math
 import argparse
 
@@ -56,8 +55,8 @@ class AudioPlayer:
         self.song_length = 0
         self.is_seeking = False
         self.animation_offset = 0
-        self.start_time = 0
-        self.start_position = 0
+        self.base_offset = 0.0  # Startposition (s) des letzten play(), get_pos() zählt ab dort
+        self.played_since_load = False  # Nach load() ohne play() liefert get_pos() noch die Uhr des alten Songs
         self.autoplay = args.autoplay
         
         # Repeat-Modus aus args setzen
@@ -393,15 +392,14 @@ class AudioPlayer:
         """Springt X Sekunden vor oder zurück"""
         if self.song_length > 0:
             # Berechne neue Position
-            elapsed = time.time() - self.start_time
-            current_pos = self.start_position + elapsed
+            current_pos = self.get_position()
             new_pos = max(0, min(current_pos + seconds, self.song_length))
             
             # Springe zur neuen Position
             try:
                 pygame.mixer.music.play(start=new_pos)
-                self.start_time = time.time()
-                self.start_position = new_pos
+                self.base_offset = new_pos
+                self.played_since_load = True
                 
                 # Aktualisiere UI
                 progress = (new_pos / self.song_length) * 100
@@ -503,10 +501,16 @@ class AudioPlayer:
     
     def format_time(self, seconds):
         """Formatiert Sekunden zu MM:SS"""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins}:{secs:02d}"
     
+    def get_position(self):
+        """Aktuelle Wiedergabeposition in Sekunden (Uhr von SDL_mixer)"""
+        # get_pos() liefert ms seit dem letzten play(), -1 wenn nichts läuft
+        if not self.played_since_load:
+            return self.base_offset
+        return self.base_offset + max(0, pygame.mixer.music.get_pos()) / 1000.0
+    
     def start_seek(self, event):
         """Startet das Seeking"""
         self.is_seeking = True
@@ -518,9 +522,9 @@ class AudioPlayer:
             position = (self.progress_var.get() / 100) * self.song_length
             try:
                 pygame.mixer.music.play(start=position)
-                # Zeit-Tracking nach Seek aktualisieren
-                self.start_time = time.time()
-                self.start_position = position
+                # get_pos() zählt ab hier neu
+                self.base_offset = position
+                self.played_since_load = True
                 if not self.is_playing:
                     pygame.mixer.music.pause()
             except:
@@ -536,9 +540,8 @@ class AudioPlayer:
         """Aktualisiert die Fortschrittsanzeige"""
         if self.is_playing and not self.is_seeking and self.song_length > 0:
             try:
-                # Berechne Position basierend auf verstrichener Zeit seit Start
-                elapsed = time.time() - self.start_time
-                pos = self.start_position + elapsed
+                # Position direkt vom Mixer (kein Drift gegenüber dem Audio)
+                pos = self.get_position()
                 
                 if pos >= 0 and pos <= self.song_length:
                     progress = (pos / self.song_length) * 100
@@ -612,8 +615,8 @@ class AudioPlayer:
                 self.progress_var.set(0)
                 
                 # Position zurücksetzen
-                self.start_position = 0
-                self.start_time = time.time()
+                self.base_offset = 0.0
+                self.played_since_load = False
                 
             except Exception as e:
                 self.title_label.config(text=f"Fehler: {str(e)}")
@@ -624,8 +627,8 @@ class AudioPlayer:
             pygame.mixer.music.play()
             self.is_playing = True
             self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-            self.start_time = time.time()
-            self.start_position = 0
+            self.base_offset = 0.0
+            self.played_since_load = True
         except Exception as e:
             self.title_label.config(text=f"Wiedergabefehler: {str(e)}")
     
@@ -634,10 +637,7 @@ class AudioPlayer:
         pygame.mixer.music.pause()
         self.is_playing = False
         self.play_btn.config(text="▶ PLAY", bg='#27ae60')
-        # Position beim Pausieren speichern
-        if hasattr(self, 'start_time'):
-            elapsed = time.time() - self.start_time
-            self.start_position = self.start_position + elapsed
+        # get_pos() steht während der Pause still, nichts zu speichern
     
     def toggle_play(self):
         """Wechselt zwischen Play und Pause"""
@@ -649,16 +649,16 @@ class AudioPlayer:
                 pygame.mixer.music.unpause()
                 self.is_playing = True
                 self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-                # Zeit beim Unpause neu setzen
-                self.start_time = time.time()
             else:
                 # Song von gespeicherter Position starten
-                if hasattr(self, 'start_position') and self.start_position > 0:
+                resume_pos = self.get_position()
+                if resume_pos > 0:
                     try:
-                        pygame.mixer.music.play(start=self.start_position)
+                        pygame.mixer.music.play(start=resume_pos)
+                        self.base_offset = resume_pos
+                        self.played_since_load = True
                         self.is_playing = True
                         self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-                        self.start_time = time.time()
                     except:
                         self.play_song()
                 else:
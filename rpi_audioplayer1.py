@@ -34,11 +34,31 @@ import pygame
 import os
 from pathlib import Path
 from mutagen import File as MutagenFile
-import time
 import math
 import argparse
+import json
 import threading
 
+# Persistenter Cache für Song-Längen (Pfad -> [mtime, size, length])
+LENGTH_CACHE_PATH = Path.home() / ".cache" / "rpi_audioplayer" / "lengths.json"
+
+# Unterstützte Endungen (kleingeschrieben, inkl. Punkt)
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a'})
+
+# SDL-Event, das der Mixer am Song-Ende auslöst
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
+# Repeat-Modi für --repeat
+REPEAT_MODES = {'off': 0, 'all': 1, 'one': 2}
+
+# Animation: Phasenzeiger der Balken und Drehung pro Frame (0.1 rad)
+NUM_BARS = 40
+BAR_PHASORS = tuple(complex(math.cos(i * 0.3), math.sin(i * 0.3)) for i in range(NUM_BARS))
+ANIM_STEP = complex(math.cos(0.1), math.sin(0.1))
+
+# Farbverlauf (#RRb4c8), Index = Rot-Anteil
+GRADIENT = tuple('#{:02x}b4c8'.format(v) for v in range(256))
+
 class AudioPlayer:
     def __init__(self, root, args=None):
         self.root = root
@@ -46,9 +66,6 @@ class AudioPlayer:
         self.root.attributes('-fullscreen', True)
         self.root.configure(bg='#2c3e50')
         
-        # Pygame Mixer initialisieren
-        pygame.mixer.init()
-        
         # Startparameter verarbeiten
         if args is None:
             args = type('obj', (object,), {
@@ -61,19 +78,37 @@ class AudioPlayer:
         
         # Variablen
         self.playlist = []
+        self.basenames = []  # Dateinamen parallel zu playlist
         self.current_index = 0
         self.is_playing = False
         self.volume = args.volume / 100.0
+        self.pending_volume = self.volume
+        self.volume_job = None  # after-ID der gebündelten Lautstärke-Änderung
         self.music_folder = args.folder if args.folder else str(Path.home() / "Music")
         self.song_length = 0
         self.is_seeking = False
-        self.animation_offset = 0
-        self.start_time = 0
-        self.start_position = 0
+        self.anim_phase = 1 + 0j  # Rotierender Zeiger der Wellenanimation
+        self.base_offset = 0.0  # Startposition (s) des letzten play(), get_pos() zählt ab dort
+        self.played_since_load = False  # Nach load() ohne play() liefert get_pos() noch die Uhr des alten Songs
+        self.last_displayed_sec = -1  # Zuletzt angezeigte Sekunde der Fortschrittsanzeige
         self.autoplay = args.autoplay
         self.crossfade_duration = args.crossfade
         self.is_fading = False
         self.fullscreen = True
+        self.mixer_ready = False  # Mixer wird erst beim ersten Song geöffnet
+        self.end_events = False  # Song-Ende per SDL-Event statt get_busy()-Polling
+        self.queued_index = None  # Per music.queue() vorgeladener Folgesong
+        self.load_token = 0  # Verwirft überholte Hintergrund-Ladevorgänge
+        self.load_pending = False  # Während des Ladens ist der Mixer gestoppt und gehört dem Lade-Thread
+        self.load_lock = threading.Lock()
+        self.length_cache = self.load_length_cache()
+        self.folder_token = 0  # Verwirft veraltete Ordner-Scans
+        self.marked_index = None  # Playlist-Zeile mit ▶-Markierung
+        
+        # Animation
+        self.bar_buckets = [-1] * NUM_BARS
+        self.bar_heights = [-1] * NUM_BARS  # Zuletzt gesetzte halbe Höhe (px)
+        self.anim_mode = None
         
         # Equalizer-Werte (0-100, 50 = neutral)
         self.eq_bass = 50
@@ -81,8 +116,7 @@ class AudioPlayer:
         self.eq_treble = 50
         
         # Repeat-Modus aus args setzen
-        repeat_modes = {'off': 0, 'all': 1, 'one': 2}
-        self.repeat_mode = repeat_modes.get(args.repeat.lower(), 1)  # Standard: 'all'
+        self.repeat_mode = REPEAT_MODES.get(args.repeat.lower(), 1)  # Standard: 'all'
         
         # Vordefinierte Ordner (kannst du anpassen!)
         self.preset_folders = [
@@ -110,8 +144,7 @@ class AudioPlayer:
         self.load_folder(self.music_folder)
         
         # Loops starten
-        self.check_music_end()
-        self.update_progress()
+        self.tick()
         self.animate()
         
     def create_widgets(self):
@@ -128,6 +161,20 @@ class AudioPlayer:
         )
         self.animation_canvas.pack(fill=tk.X, pady=10)
         
+        # Persistente Items: werden pro Frame nur verschoben/umgefärbt statt neu erzeugt
+        self.anim_bars = [
+            self.animation_canvas.create_rectangle(0, 0, 0, 0, fill='#9bb4c8', outline='', tags='bar')
+            for _ in range(NUM_BARS)
+        ]
+        self.anim_line = self.animation_canvas.create_line(
+            0, 0, 0, 0,
+            fill='#95a5a6',
+            width=3,
+            state='hidden'
+        )
+        self.recompute_bar_geometry()
+        self.animation_canvas.bind('<Configure>', self.recompute_bar_geometry)
+        
         # Titel-Label
         self.title_label = tk.Label(
             main_frame,
@@ -459,7 +506,7 @@ class AudioPlayer:
         exit_btn = tk.Button(
             main_frame,
             text="BEENDEN",
-            command=self.root.quit,
+            command=self.quit_app,
             font=('Arial', 12, 'bold'),
             bg='#e74c3c',
             fg='white',
@@ -482,15 +529,31 @@ class AudioPlayer:
         self.root.bind('R', lambda e: self.toggle_repeat())
         self.root.bind('f', lambda e: self.toggle_fullscreen())
         self.root.bind('F', lambda e: self.toggle_fullscreen())
-        self.root.bind('q', lambda e: self.root.quit())
-        self.root.bind('Q', lambda e: self.root.quit())
-        self.root.bind('<Escape>', lambda e: self.root.quit())
+        self.root.bind('q', lambda e: self.quit_app())
+        self.root.bind('Q', lambda e: self.quit_app())
+        self.root.bind('<Escape>', lambda e: self.quit_app())
     
     def toggle_fullscreen(self):
         """Wechselt zwischen Fullscreen und Fenster-Modus"""
         self.fullscreen = not self.fullscreen
         self.root.attributes('-fullscreen', self.fullscreen)
     
+    def ensure_mixer(self):
+        """Öffnet den Pygame Mixer beim ersten Bedarf"""
+        if self.mixer_ready:
+            return
+        # Event-Queue braucht das Video-Subsystem (es wird kein Fenster geöffnet)
+        try:
+            pygame.display.init()
+            self.end_events = True
+        except pygame.error as e:
+            print(f"Kein SDL-Event-System, nutze Polling: {e}")
+        # Großer Puffer: weniger Wakeups/xruns auf dem Pi, Latenz egal für Musik
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
+        pygame.mixer.music.set_volume(self.volume)
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        self.mixer_ready = True
+    
     def crossfade_to_next(self):
         """Crossfade zum nächsten Song (Fade-Out + Fade-In)"""
         if self.is_fading or not self.is_playing:
@@ -498,61 +561,54 @@ class AudioPlayer:
         
         self.is_fading = True
         
-        def fade():
-            # Fade-Out
-            steps = 20
-            fade_step = self.crossfade_duration / steps
-            
-            for i in range(steps, 0, -1):
-                if not self.is_fading:
-                    return
-                vol = self.volume * (i / steps)
-                pygame.mixer.music.set_volume(vol)
-                time.sleep(fade_step)
-            
-            # Nächsten Song laden
-            if self.repeat_mode == 2:
-                self.load_song(self.current_index)
-            else:
-                self.current_index = (self.current_index + 1) % len(self.playlist)
-                self.load_song(self.current_index)
-            
-            # Song starten und Fade-In
-            pygame.mixer.music.play()
-            
-            for i in range(1, steps + 1):
-                if not self.is_fading:
-                    return
-                vol = self.volume * (i / steps)
-                pygame.mixer.music.set_volume(vol)
-                time.sleep(fade_step)
-            
-            # Finale Lautstärke setzen
-            pygame.mixer.music.set_volume(self.volume)
-            self.is_fading = False
+        # Fade-Out läuft nativ im SDL_mixer-Callback (sampelgenau, ohne Python-Thread)
+        fade_ms = int(self.crossfade_duration * 1000)
+        # Kein Ende-Event für den ausgeblendeten Song
+        pygame.mixer.music.set_endevent()
+        pygame.mixer.music.fadeout(fade_ms)
+        self.root.after(fade_ms, self.finish_crossfade)
+    
+    def finish_crossfade(self):
+        """Nächsten Song laden und mit Fade-In starten (Tk-Mainthread)"""
+        if not self.is_fading:
+            return
+        
+        # Fade-Out sicher beenden und Ende-Event wieder aktivieren
+        pygame.mixer.music.stop()
+        if self.end_events:
+            pygame.event.clear(MUSIC_END_EVENT)
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        
+        self.is_fading = False
         
-        # Fade in separatem Thread ausführen
-        fade_thread = threading.Thread(target=fade, daemon=True)
-        fade_thread.start()
+        # Nächsten Song laden
+        if self.repeat_mode != 2:
+            self.current_index = (self.current_index + 1) % len(self.playlist)
+        
+        # Song starten, Fade-In übernimmt ebenfalls SDL_mixer
+        fade_ms = int(self.crossfade_duration * 1000)
+        self.load_song(self.current_index, on_loaded=lambda: self.play_song(fade_ms=fade_ms))
     
     def skip_seconds(self, seconds):
         """Springt X Sekunden vor oder zurück"""
+        if self.load_pending:
+            return  # Lade-Thread arbeitet am Mixer, Position gehört ohnehin zum alten Song
         if self.song_length > 0:
             # Berechne neue Position
-            elapsed = time.time() - self.start_time
-            current_pos = self.start_position + elapsed
+            current_pos = self.get_position()
             new_pos = max(0, min(current_pos + seconds, self.song_length))
             
             # Springe zur neuen Position
             try:
                 pygame.mixer.music.play(start=new_pos)
-                self.start_time = time.time()
-                self.start_position = new_pos
+                self.base_offset = new_pos
+                self.played_since_load = True
                 
                 # Aktualisiere UI
                 progress = (new_pos / self.song_length) * 100
                 self.progress_var.set(progress)
                 self.current_time_label.config(text=self.format_time(new_pos))
+                self.last_displayed_sec = -1
                 
                 if not self.is_playing:
                     pygame.mixer.music.pause()
@@ -573,60 +629,79 @@ class AudioPlayer:
     
     def animate(self):
         """Animiert Wellenlinien beim Abspielen"""
-        self.animation_canvas.delete("all")
+        canvas = self.animation_canvas
+        
+        # Nicht sichtbar (z.B. minimiert): nichts zeichnen
+        if not canvas.winfo_viewable():
+            self.root.after(50, self.animate)
+            return
         
         if self.is_playing:
-            width = self.animation_canvas.winfo_width()
-            if width <= 1:
-                width = 800  # Fallback
+            if self.anim_mode != 'bars':
+                canvas.itemconfigure(self.anim_line, state='hidden')
+                canvas.itemconfigure('bar', state='normal')
+                self.anim_mode = 'bars'
             
-            height = 60
-            center_y = height // 2
+            center_y = self.bar_y_center
+            bar_x0 = self.bar_x0
+            bar_x1 = self.bar_x1
+            bar_heights = self.bar_heights
             
-            # Mehrere Wellenlinien zeichnen
-            num_bars = 40
-            bar_width = width / num_bars
+            # Imaginärteil von Balken-Zeiger * Frame-Zeiger = sin(i*0.3 + Frame*0.1)
+            phase = self.anim_phase
             
-            for i in range(num_bars):
+            for i, bar_id in enumerate(self.anim_bars):
                 # Wellenförmige Animation
-                wave = math.sin((i * 0.3) + (self.animation_offset * 0.1)) * 0.5 + 0.5
-                bar_height = 5 + wave * 25
-                
-                x = i * bar_width + bar_width / 2
+                wave = (BAR_PHASORS[i] * phase).imag * 0.5 + 0.5
                 
-                # Farbverlauf von grün zu blau
-                color_value = int(wave * 100 + 155)
-                color = f'#{color_value:02x}{180:02x}{200:02x}'
+                # Balken nur verschieben wenn sich die Pixelhöhe ändert
+                half_height = int(2.5 + wave * 12.5)
+                if half_height != bar_heights[i]:
+                    bar_heights[i] = half_height
+                    canvas.coords(
+                        bar_id,
+                        bar_x0[i],
+                        center_y - half_height,
+                        bar_x1[i],
+                        center_y + half_height
+                    )
                 
-                # Balken zeichnen
-                self.animation_canvas.create_rectangle(
-                    x - bar_width / 3,
-                    center_y - bar_height / 2,
-                    x + bar_width / 3,
-                    center_y + bar_height / 2,
-                    fill=color,
-                    outline=''
-                )
+                # Farbverlauf von grün zu blau (16 Stufen, nur bei Wechsel setzen)
+                bucket = int(wave * 15)
+                if bucket != self.bar_buckets[i]:
+                    self.bar_buckets[i] = bucket
+                    canvas.itemconfigure(bar_id, fill=GRADIENT[int(bucket / 15 * 100 + 155)])
             
-            self.animation_offset += 1
+            # Zeiger weiterdrehen, Betrag auf 1 halten (Rundungsdrift)
+            phase *= ANIM_STEP
+            self.anim_phase = phase / abs(phase)
         else:
             # Statische Linie wenn pausiert
-            width = self.animation_canvas.winfo_width()
-            if width <= 1:
-                width = 800
-            self.animation_canvas.create_line(
-                50, 30, width - 50, 30,
-                fill='#95a5a6',
-                width=3
-            )
+            if self.anim_mode != 'line':
+                canvas.itemconfigure('bar', state='hidden')
+                canvas.itemconfigure(self.anim_line, state='normal')
+                self.anim_mode = 'line'
         
         # Animation wiederholen
         self.root.after(50, self.animate)
     
+    def recompute_bar_geometry(self, event=None):
+        """Berechnet Balken-Positionen neu wenn sich die Canvas-Größe ändert"""
+        width = event.width if event is not None and event.width > 1 else 800  # Fallback
+        bar_width = width / NUM_BARS
+        centers = [i * bar_width + bar_width / 2 for i in range(NUM_BARS)]
+        self.bar_x0 = [x - bar_width / 3 for x in centers]
+        self.bar_x1 = [x + bar_width / 3 for x in centers]
+        self.bar_y_center = 30
+        self.bar_heights = [-1] * NUM_BARS  # Alle Balken neu positionieren
+        self.animation_canvas.coords(self.anim_line, 50, 30, width - 50, 30)
+    
     def toggle_repeat(self):
         """Wechselt zwischen Repeat-Modi"""
         self.repeat_mode = (self.repeat_mode + 1) % 3
         self.update_repeat_button()
+        if self.mixer_ready:
+            self.queue_next()
     
     def update_repeat_button(self):
         """Aktualisiert den Repeat-Button basierend auf repeat_mode"""
@@ -638,21 +713,64 @@ class AudioPlayer:
             self.repeat_btn.config(text="🔂 EINS", bg='#f39c12')
     
     def get_song_length(self, filepath):
-        """Ermittelt die Länge des Songs in Sekunden"""
+        """Ermittelt die Länge des Songs in Sekunden (gecacht nach mtime/size)"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return 0
+        
+        cached = self.length_cache.get(filepath)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            return cached[2]
+        
+        length = 0
         try:
             audio = MutagenFile(filepath)
             if audio and hasattr(audio.info, 'length'):
-                return audio.info.length
+                length = audio.info.length
         except:
             pass
-        return 0
+        self.length_cache[filepath] = [st.st_mtime, st.st_size, length]
+        return length
+    
+    def prewarm_lengths(self, paths):
+        """Füllt den Längen-Cache im Hintergrund (bricht ab wenn Playlist wechselt)"""
+        for path in paths:
+            if paths is not self.playlist:
+                return
+            self.get_song_length(path)
+    
+    def load_length_cache(self):
+        """Lädt den Längen-Cache von der Platte"""
+        try:
+            if LENGTH_CACHE_PATH.exists():
+                data = json.loads(LENGTH_CACHE_PATH.read_text(encoding='utf-8'))
+                if isinstance(data, dict):
+                    return data
+        except Exception:
+            pass
+        return {}
+    
+    def save_length_cache(self):
+        """Speichert den Längen-Cache"""
+        try:
+            LENGTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            LENGTH_CACHE_PATH.write_text(json.dumps(dict(self.length_cache)), encoding='utf-8')
+        except Exception:
+            pass
     
     def format_time(self, seconds):
         """Formatiert Sekunden zu MM:SS"""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins}:{secs:02d}"
     
+    def get_position(self):
+        """Aktuelle Wiedergabeposition in Sekunden (Uhr von SDL_mixer)"""
+        # get_pos() liefert ms seit dem letzten play(), -1 wenn nichts läuft
+        if not self.played_since_load:
+            return self.base_offset
+        return self.base_offset + max(0, pygame.mixer.music.get_pos()) / 1000.0
+    
     def start_seek(self, event):
         """Startet das Seeking"""
         self.is_seeking = True
@@ -660,13 +778,16 @@ class AudioPlayer:
     def end_seek(self, event):
         """Beendet das Seeking und springt zur Position"""
         self.is_seeking = False
+        if self.load_pending:
+            return  # Lade-Thread arbeitet am Mixer
         if self.song_length > 0:
             position = (self.progress_var.get() / 100) * self.song_length
             try:
                 pygame.mixer.music.play(start=position)
                 # Zeit-Tracking nach Seek aktualisieren
-                self.start_time = time.time()
-                self.start_position = position
+                self.base_offset = position
+                self.played_since_load = True
+                self.last_displayed_sec = -1
                 if not self.is_playing:
                     pygame.mixer.music.pause()
             except:
@@ -678,48 +799,100 @@ class AudioPlayer:
             current = (float(val) / 100) * self.song_length
             self.current_time_label.config(text=self.format_time(current))
     
+    def tick(self):
+        """Gemeinsamer Takt für Song-Ende, Crossfade und Fortschrittsanzeige"""
+        visible = self.root.state() != 'iconic'
+        self.check_music_end()
+        if visible:
+            self.update_progress()
+        
+        # Ohne Fokus (oder minimiert) reicht ein gröberer Takt
+        interval = 500 if visible and self.root.focus_displayof() is not None else 1000
+        
+        # Nächsten Takt genau auf den Crossfade-Start legen statt bis zu 1 s zu spät
+        due = self.crossfade_due_in()
+        if due is not None:
+            interval = max(50, min(interval, int(due * 1000)))
+        self.root.after(interval, self.tick)
+    
+    def crossfade_due_in(self):
+        """Sekunden bis zum Crossfade-Start (None = kein Crossfade anstehend)"""
+        if (not self.is_playing or self.is_fading or self.load_pending
+                or self.song_length <= 0 or self.crossfade_duration <= 0):
+            return None
+        if not (self.repeat_mode == 1 or
+                (self.repeat_mode == 0 and self.current_index < len(self.playlist) - 1)):
+            return None
+        return max(0.0, self.song_length - self.crossfade_duration - self.get_position())
+    
     def update_progress(self):
         """Aktualisiert die Fortschrittsanzeige"""
-        if self.is_playing and not self.is_seeking and self.song_length > 0:
+        if self.is_playing and not self.is_seeking and self.song_length > 0 and not self.load_pending:
             try:
-                # Berechne Position basierend auf verstrichener Zeit seit Start
-                elapsed = time.time() - self.start_time
-                pos = self.start_position + elapsed
+                # Position direkt vom Mixer (kein Drift gegenüber dem Audio)
+                pos = self.get_position()
                 
-                if pos >= 0 and pos <= self.song_length:
+                # Nur neu zeichnen wenn eine volle Sekunde weiter
+                int_sec = int(pos)
+                if pos >= 0 and pos <= self.song_length and int_sec != self.last_displayed_sec:
+                    self.last_displayed_sec = int_sec
                     progress = (pos / self.song_length) * 100
                     self.progress_var.set(progress)
                     self.current_time_label.config(text=self.format_time(pos))
             except:
                 pass
-        
-        self.root.after(500, self.update_progress)
     
     def load_folder(self, folder_path):
-        """Lädt alle Audio-Dateien aus dem Ordner"""
+        """Lädt alle Audio-Dateien aus dem Ordner (Scan im Hintergrund)"""
+        self.folder_token += 1
+        token = self.folder_token
+        
+        def worker():
+            try:
+                result = self.scan_folder_blocking(folder_path)
+            except Exception as e:
+                result = e
+            # Ergebnis im Tk-Mainthread übernehmen
+            self.root.after(0, self.apply_playlist, token, folder_path, result)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def scan_folder_blocking(self, folder_path):
+        """Liest die Audio-Dateien eines Ordners (None wenn nicht vorhanden)"""
         if not os.path.exists(folder_path):
+            return None
+        
+        # scandir liefert Name + Typ in einem Rutsch (kein stat pro Eintrag)
+        with os.scandir(folder_path) as it:
+            entries = [e for e in it
+                       if e.is_file() and os.path.splitext(e.name)[1].lower() in AUDIO_EXTENSIONS]
+        entries.sort(key=lambda e: e.name)
+        return [e.path for e in entries]
+    
+    def apply_playlist(self, token, folder_path, result):
+        """Übernimmt das Scan-Ergebnis in Playlist und UI"""
+        if token != self.folder_token:
+            return  # Inzwischen wurde ein anderer Ordner gewählt
+        
+        if result is None:
             self.title_label.config(text=f"Ordner nicht gefunden: {folder_path}")
             return
+        if isinstance(result, Exception):
+            self.title_label.config(text=f"Fehler beim Laden: {str(result)}")
+            return
         
-        self.playlist = []
-        audio_extensions = ('.mp3', '.wav', '.ogg', '.flac', '.m4a')
-        
-        try:
-            for file in sorted(os.listdir(folder_path)):
-                if file.lower().endswith(audio_extensions):
-                    self.playlist.append(os.path.join(folder_path, file))
+        self.playlist = result
+        self.basenames = [os.path.basename(path) for path in result]
+        if self.playlist:
+            # Längen aller Songs vorab im Hintergrund ermitteln
+            threading.Thread(target=self.prewarm_lengths, args=(self.playlist,), daemon=True).start()
             
-            if self.playlist:
-                self.current_index = 0
-                self.update_playlist_display()
-                self.load_song(self.current_index)
-                # Autoplay starten (falls aktiviert)
-                if self.autoplay:
-                    self.play_song()
-            else:
-                self.title_label.config(text="Keine Audiodateien gefunden")
-        except Exception as e:
-            self.title_label.config(text=f"Fehler beim Laden: {str(e)}")
+            self.current_index = 0
+            self.update_playlist_display()
+            # Autoplay starten (falls aktiviert)
+            self.load_song(self.current_index, on_loaded=self.play_song if self.autoplay else None)
+        else:
+            self.title_label.config(text="Keine Audiodateien gefunden")
     
     def load_folder_button(self):
         """Lädt Ordner über Button"""
@@ -730,48 +903,161 @@ class AudioPlayer:
     def update_playlist_display(self):
         """Aktualisiert die Playlist-Anzeige"""
         self.playlist_box.delete(0, tk.END)
-        for i, song in enumerate(self.playlist):
-            filename = os.path.basename(song)
-            prefix = "▶ " if i == self.current_index else "   "
-            self.playlist_box.insert(tk.END, f"{prefix}{filename}")
+        # Alle Zeilen mit einem einzigen Tcl-Aufruf einfügen
+        items = [f"{'▶ ' if i == self.current_index else '   '}{filename}"
+                 for i, filename in enumerate(self.basenames)]
+        if items:
+            self.playlist_box.insert(tk.END, *items)
+        self.marked_index = self.current_index if items else None
         
         if self.playlist:
-            self.playlist_box.selection_clear(0, tk.END)
-            self.playlist_box.selection_set(self.current_index)
-            self.playlist_box.see(self.current_index)
+            self.select_row(self.current_index)
     
-    def load_song(self, index):
-        """Lädt einen Song"""
-        if 0 <= index < len(self.playlist):
-            try:
-                filepath = self.playlist[index]
-                pygame.mixer.music.load(filepath)
-                filename = os.path.basename(filepath)
-                self.title_label.config(text=filename)
-                self.current_index = index
-                self.update_playlist_display()
-                
-                # Song-Länge ermitteln
-                self.song_length = self.get_song_length(filepath)
-                self.total_time_label.config(text=self.format_time(self.song_length))
-                self.current_time_label.config(text="0:00")
-                self.progress_var.set(0)
-                
-                # Position zurücksetzen
-                self.start_position = 0
-                self.start_time = time.time()
-                
-            except Exception as e:
-                self.title_label.config(text=f"Fehler: {str(e)}")
+    def refresh_row(self, i, is_current):
+        """Schreibt eine einzelne Playlist-Zeile neu"""
+        self.playlist_box.delete(i)
+        self.playlist_box.insert(i, f"{'▶ ' if is_current else '   '}{self.basenames[i]}")
+    
+    def mark_current_row(self):
+        """Verschiebt die ▶-Markierung, ändert nur die beiden betroffenen Zeilen"""
+        index = self.current_index
+        if index != self.marked_index:
+            if self.marked_index is not None and self.marked_index < len(self.basenames):
+                self.refresh_row(self.marked_index, False)
+            self.refresh_row(index, True)
+            self.marked_index = index
+        self.select_row(index)
+    
+    def select_row(self, index):
+        """Markiert und zeigt eine Zeile der Playlist-Auswahl"""
+        self.playlist_box.selection_clear(0, tk.END)
+        self.playlist_box.selection_set(index)
+        self.playlist_box.see(index)
+    
+    def load_song(self, index, on_loaded=None):
+        """Lädt einen Song im Hintergrund, on_loaded läuft danach im Tk-Mainthread"""
+        if not 0 <= index < len(self.playlist):
+            return
+        
+        self.ensure_mixer()
+        if self.is_fading:
+            # Manueller Songwechsel bricht einen laufenden Crossfade ab
+            self.is_fading = False
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        
+        self.load_token += 1
+        token = self.load_token
+        self.load_pending = True
+        self.current_index = index
+        self.queued_index = None  # load() verwirft die Queue
+        self.title_label.config(text=self.basenames[index])
+        
+        filepath = self.playlist[index]
+        queue_index = self.next_queue_index()
+        
+        def worker():
+            queued = queue_index
+            error = None
+            with self.load_lock:
+                if token != self.load_token:
+                    return  # Von einem neueren load_song überholt
+                try:
+                    pygame.mixer.music.load(filepath)
+                except Exception as e:
+                    error = e
+                if error is None and queued is not None:
+                    try:
+                        pygame.mixer.music.queue(self.playlist[queued])
+                    except Exception as e:
+                        print(f"Queue-Fehler: {e}")
+                        queued = None
+            self.root.after(0, self.finish_load_song, token, index, queued, error, on_loaded)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def finish_load_song(self, token, index, queued, error, on_loaded):
+        """Übernimmt einen fertig geladenen Song in die UI"""
+        if token != self.load_token:
+            return
+        self.load_pending = False
+        if error is not None:
+            self.title_label.config(text=f"Fehler: {str(error)}")
+            return
+        
+        self.queued_index = queued
+        self.show_song(index)
+        if on_loaded:
+            on_loaded()
+    
+    def show_song(self, index):
+        """Zeigt Titel, Länge und Position des aktuellen Songs an"""
+        filepath = self.playlist[index]
+        self.title_label.config(text=self.basenames[index])
+        self.current_index = index
+        self.mark_current_row()
+        
+        # Song-Länge erst nach dem Zeichnen im Hintergrund ermitteln
+        self.song_length = 0
+        self.total_time_label.config(text="…")
+        self.root.after_idle(self.resolve_length, index, filepath)
+        self.current_time_label.config(text="0:00")
+        self.progress_var.set(0)
+        self.last_displayed_sec = -1
+        
+        # Position zurücksetzen
+        self.base_offset = 0.0
+        self.played_since_load = False
+    
+    def resolve_length(self, index, filepath):
+        """Ermittelt die Song-Länge (Cache oder Mutagen) im Hintergrund"""
+        def worker():
+            length = self.get_song_length(filepath)
+            self.root.after(0, self.apply_length, index, filepath, length)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def apply_length(self, index, filepath, length):
+        """Zeigt die ermittelte Song-Länge an (falls der Song noch aktuell ist)"""
+        if index != self.current_index or index >= len(self.playlist) or self.playlist[index] != filepath:
+            return
+        self.song_length = length
+        self.total_time_label.config(text=self.format_time(length))
+        self.last_displayed_sec = -1
+    
+    def next_queue_index(self):
+        """Index des Songs für music.queue() (None = nichts vorladen)"""
+        # Crossfade übernimmt den Übergang selbst, ohne Events fehlt die UI-Umschaltung
+        if self.crossfade_duration > 0 or not self.end_events or not self.playlist:
+            return None
+        if self.repeat_mode == 2:  # Repeat One
+            return self.current_index
+        if self.repeat_mode == 0 and self.current_index >= len(self.playlist) - 1:
+            return None  # Letzter Song ohne Repeat (bereits Vorgeladenes bleibt, on_song_end stoppt)
+        return (self.current_index + 1) % len(self.playlist)
+    
+    def queue_next(self):
+        """Lädt den Folgesong per music.queue() vor (lückenloser Übergang)"""
+        if self.load_pending:
+            return  # Der Lade-Thread reiht den Folgesong selbst ein
+        nxt = self.next_queue_index()
+        if nxt is None:
+            return
+        try:
+            pygame.mixer.music.queue(self.playlist[nxt])
+            self.queued_index = nxt
+        except Exception as e:
+            print(f"Queue-Fehler: {e}")
     
-    def play_song(self):
+    def play_song(self, fade_ms=0):
         """Startet die Wiedergabe"""
+        if self.load_pending:
+            return  # Nach dem Laden startet on_loaded die Wiedergabe
         try:
-            pygame.mixer.music.play()
+            pygame.mixer.music.play(fade_ms=fade_ms)
             self.is_playing = True
             self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-            self.start_time = time.time()
-            self.start_position = 0
+            self.base_offset = 0.0
+            self.played_since_load = True
         except Exception as e:
             self.title_label.config(text=f"Wiedergabefehler: {str(e)}")
     
@@ -780,13 +1066,15 @@ class AudioPlayer:
         pygame.mixer.music.pause()
         self.is_playing = False
         self.play_btn.config(text="▶ PLAY", bg='#27ae60')
-        # Position beim Pausieren speichern
-        if hasattr(self, 'start_time'):
-            elapsed = time.time() - self.start_time
-            self.start_position = self.start_position + elapsed
     
     def toggle_play(self):
         """Wechselt zwischen Play und Pause"""
+        if not self.mixer_ready:
+            return
+        if self.load_pending:
+            # Mixer gehört gerade dem Lade-Thread: Tastendruck kurz zurückstellen
+            self.root.after(50, self.toggle_play)
+            return
         if self.is_playing:
             self.pause_song()
         else:
@@ -795,16 +1083,16 @@ class AudioPlayer:
                 pygame.mixer.music.unpause()
                 self.is_playing = True
                 self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-                # Zeit beim Unpause neu setzen
-                self.start_time = time.time()
             else:
                 # Song von gespeicherter Position starten
-                if hasattr(self, 'start_position') and self.start_position > 0:
+                resume_pos = self.get_position()
+                if resume_pos > 0:
                     try:
-                        pygame.mixer.music.play(start=self.start_position)
+                        pygame.mixer.music.play(start=resume_pos)
+                        self.base_offset = resume_pos
+                        self.played_since_load = True
                         self.is_playing = True
                         self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
-                        self.start_time = time.time()
                     except:
                         self.play_song()
                 else:
@@ -813,66 +1101,92 @@ class AudioPlayer:
     def next_song(self):
         """Nächster Song"""
         if self.playlist:
-            if self.repeat_mode == 2:  # Repeat One
-                # Gleichen Song neu starten
-                self.load_song(self.current_index)
-            else:
+            if self.repeat_mode != 2:  # Bei Repeat One gleichen Song neu starten
                 self.current_index = (self.current_index + 1) % len(self.playlist)
-                self.load_song(self.current_index)
             
-            if self.is_playing or True:  # Autoplay
-                self.play_song()
+            # Autoplay
+            self.load_song(self.current_index, on_loaded=self.play_song)
     
     def previous_song(self):
         """Vorheriger Song"""
         if self.playlist:
             self.current_index = (self.current_index - 1) % len(self.playlist)
-            self.load_song(self.current_index)
-            if self.is_playing:
-                self.play_song()
+            self.load_song(self.current_index, on_loaded=self.play_song if self.is_playing else None)
     
     def change_volume(self, val):
-        """Ändert die Lautstärke"""
-        self.volume = float(val) / 100
-        pygame.mixer.music.set_volume(self.volume)
+        """Ändert die Lautstärke (gebündelt, Slider feuert pro Pixel)"""
+        self.pending_volume = float(val) / 100
+        if self.volume_job is None:
+            self.volume_job = self.root.after(30, self.apply_volume)
+    
+    def apply_volume(self):
+        """Übernimmt die zuletzt gewählte Lautstärke in den Mixer"""
+        self.volume_job = None
+        if self.load_pending:
+            # Mixer erst nach dem Laden wieder anfassen
+            self.volume_job = self.root.after(30, self.apply_volume)
+            return
+        self.volume = self.pending_volume
+        if self.mixer_ready:
+            pygame.mixer.music.set_volume(self.volume)
     
     def on_playlist_select(self, event):
         """Song aus Playlist auswählen"""
         selection = self.playlist_box.curselection()
         if selection:
             index = selection[0]
-            self.load_song(index)
-            if self.is_playing:
-                self.play_song()
+            self.load_song(index, on_loaded=self.play_song if self.is_playing else None)
+    
+    def on_song_end(self):
+        """Wird aufgerufen wenn ein Song zu Ende ist"""
+        if self.queued_index is not None:
+            # SDL_mixer spielt den vorgeladenen Song bereits, nur UI nachziehen
+            nxt = self.queued_index
+            self.queued_index = None
+            if self.repeat_mode == 0 and self.current_index >= len(self.playlist) - 1:
+                # Repeat wurde nach dem Vorladen abgeschaltet
+                pygame.mixer.music.stop()
+                self.is_playing = False
+                self.play_btn.config(text="▶ PLAY", bg='#27ae60')
+                return
+            self.show_song(nxt)
+            self.played_since_load = True  # Der Queue-Song läuft schon, get_pos() zählt ab seinem Start
+            self.queue_next()
+        elif self.repeat_mode == 2:  # Repeat One
+            self.load_song(self.current_index, on_loaded=self.play_song)
+        elif self.repeat_mode == 1:  # Repeat All
+            self.next_song()
+        elif self.repeat_mode == 0:  # Kein Repeat
+            # Nur weiterspielen wenn nicht letzter Song
+            if self.current_index < len(self.playlist) - 1:
+                self.next_song()
+            else:
+                self.is_playing = False
+                self.play_btn.config(text="▶ PLAY", bg='#27ae60')
     
     def check_music_end(self):
         """Prüft ob Song zu Ende ist"""
-        if not pygame.mixer.music.get_busy() and self.is_playing and not self.is_fading:
-            if self.repeat_mode == 2:  # Repeat One
-                self.load_song(self.current_index)
-                self.play_song()
-            elif self.repeat_mode == 1:  # Repeat All
-                self.next_song()
-            elif self.repeat_mode == 0:  # Kein Repeat
-                # Nur weiterspielen wenn nicht letzter Song
-                if self.current_index < len(self.playlist) - 1:
-                    self.next_song()
-                else:
-                    self.is_playing = False
-                    self.play_btn.config(text="▶ PLAY", bg='#27ae60')
+        if not self.mixer_ready:
+            return
         
-        # Crossfade früh starten (X Sekunden vor Ende)
-        if self.is_playing and not self.is_fading and self.song_length > 0 and self.crossfade_duration > 0:
-            elapsed = time.time() - self.start_time
-            pos = self.start_position + elapsed
-            
-            # Starte Crossfade wenn nur noch crossfade_duration Sekunden übrig
-            if pos >= (self.song_length - self.crossfade_duration):
-                if (self.repeat_mode == 1 or 
-                    (self.repeat_mode == 0 and self.current_index < len(self.playlist) - 1)):
-                    self.crossfade_to_next()
+        if self.end_events:
+            ended = any(e.type == MUSIC_END_EVENT for e in pygame.event.get())
+        else:
+            ended = not self.load_pending and not pygame.mixer.music.get_busy()
+        
+        if ended and self.is_playing and not self.is_fading and not self.load_pending:
+            self.on_song_end()
         
-        self.root.after(1000, self.check_music_end)
+        # Crossfade früh starten (X Sekunden vor Ende)
+        due = self.crossfade_due_in()
+        if due is not None and due <= 0:
+            self.crossfade_to_next()
+
+    
+    def quit_app(self):
+        """Beendet die Anwendung sauber"""
+        self.save_length_cache()
+        self.root.quit()
 
 
 if __name__ == "__main__":
@@ -35,30 +35,91 @@ import os
 import json
 import random
 import math
+import time
 import argparse
+import functools
 from pathlib import Path
 
 import customtkinter as ctk
 import vlc
-from mutagen import File as MutagenFile
 from tkinter import filedialog as fd
 import subprocess
 import shutil
+import shlex
 import tkinter as tk
 import threading
+import concurrent.futures
+import importlib.util
 
 # --- Optionale Module für echte Audioanalyse ---
+# sounddevice wird erst bei Bedarf geladen (_sounddevice), hier nur prüfen ob vorhanden
 AUDIO_ANALYSIS_AVAILABLE = False
 try:
-    import sounddevice as sd
     import numpy as np
-    AUDIO_ANALYSIS_AVAILABLE = True
+    AUDIO_ANALYSIS_AVAILABLE = importlib.util.find_spec("sounddevice") is not None
 except Exception:
+    pass
+if not AUDIO_ANALYSIS_AVAILABLE:
     print("⚠️ sounddevice/numpy nicht installiert – Visualizer nutzt Fallback.")
 
+_sd = None
+
+
+def _sounddevice():
+    """sounddevice beim ersten Aufruf importieren und zwischenspeichern (None wenn nicht ladbar).
+
+    Schlägt der Import fehl (z.B. PortAudio fehlt), wird AUDIO_ANALYSIS_AVAILABLE
+    zurückgesetzt, damit die Visualizer wieder den Fallback zeichnen.
+    """
+    global _sd, AUDIO_ANALYSIS_AVAILABLE
+    if _sd is None and AUDIO_ANALYSIS_AVAILABLE:
+        try:
+            import sounddevice
+            _sd = sounddevice
+        except Exception as e:
+            AUDIO_ANALYSIS_AVAILABLE = False
+            print(f"⚠️ sounddevice konnte nicht geladen werden: {e} – Visualizer nutzt Fallback.")
+    return _sd
+
+
+_rfft_fn = None
+
+
+def _rfft():
+    """rfft-Implementierung beim ersten Spektrum wählen: scipy.fft falls installiert, sonst NumPy.
+
+    scipy.fft hält die Pläne (Twiddle-Faktoren) in einem Cache und rechnet float32 in
+    einfacher Genauigkeit; NumPy 1.x baut den Plan bei jedem Aufruf neu auf.
+    """
+    global _rfft_fn
+    if _rfft_fn is None:
+        try:
+            from scipy.fft import rfft
+            _rfft_fn = rfft
+        except Exception:
+            _rfft_fn = np.fft.rfft
+    return _rfft_fn
+
 FAV_PATH = Path.home() / ".audioplayer_ctk_favorites.json"
 CFG_PATH = Path.home() / ".audioplayer_ctk_config.json"
 AUDIO_EXT = ('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac', '.wma')
+AUDIO_EXT_SET = frozenset(AUDIO_EXT)
+# Farbstufen der Balken (Index = Zahl der überschrittenen Schwellen)
+SPEC_COLORS = ('#3498db', '#9b59b6', '#e74c3c')  # Schwellen 0.4 / 0.7
+VU_COLORS = ('#27ae60', '#f39c12', '#e74c3c')  # Schwellen 0.7 / 0.85
+# Sinustabelle für die Fallback-Animationen (ohne numpy nutzbar)
+SIN_LUT_SIZE = 1024
+SIN_LUT = [math.sin(2 * math.pi * i / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE)]
+SIN_LUT_SCALE = SIN_LUT_SIZE / (2 * math.pi)
+
+
+def _sin_lut(x: float) -> float:
+    """Genäherter Sinus aus SIN_LUT (Auflösung 2π/1024, für die Anzeige ausreichend)."""
+    return SIN_LUT[int(x * SIN_LUT_SCALE) & (SIN_LUT_SIZE - 1)]
+
+
+# Ziel-Bildrate je Visualizer; Spektrum/Welle ~ Blockrate des Analyzers (44100/2048 ≈ 21 Hz)
+VIZ_TARGET_FPS = {'none': 2, 'paused': 8, 'vu_meter': 10, 'spectrum': 20, 'wave': 20}
 
 
 # =========================
@@ -77,16 +138,48 @@ class AudioAnalyzer:
         # dynamische Werte
         self.current_rms_l = 0.0
         self.current_rms_r = 0.0
-        self.spectrum = np.zeros(20) if AUDIO_ANALYSIS_AVAILABLE else None
+
+        # Bänder über das rfft-Ergebnis, einmalig aus block_size berechnet
+        self.num_bands = 20
+        self.num_bins = self.block_size // 2 + 1
+        self.band_size = max(1, self.num_bins // self.num_bands)
+        self.usable_bins = self.num_bands * self.band_size
+        self.spectrum = np.zeros(self.num_bands, dtype=np.float32) if AUDIO_ANALYSIS_AVAILABLE else None
+
+        # Arbeitspuffer für den Callback (einmal anlegen statt pro Block)
+        if AUDIO_ANALYSIS_AVAILABLE:
+            self._mono = np.empty(self.block_size, dtype=np.float32)
+            self._mag = np.empty(self.num_bins, dtype=np.float32)
+            self._mag_im = np.empty(self.num_bins, dtype=np.float32)
+            self._mag_min = np.empty(self.num_bins, dtype=np.float32)
+            self._bands = np.empty(self.num_bands, dtype=np.float32)
 
         self.stream = None
 
-        # Ringpuffer für Wave-Ansicht (synchron)
+        # Ringpuffer für Wave-Ansicht: jedes 11. Sample (~4 kHz) reicht für die Kontur
         self.wave_secs = 1.0  # ca. 1 Sekunde Verlauf puffern
-        buf_len = int(self.sample_rate * self.wave_secs)
+        self.wave_decim = 11
+        self.wave_rate = self.sample_rate / self.wave_decim  # Samples/s in wave_buffer
+        # Länge auf Zweierpotenz aufrunden: Ringindex per Bitmaske statt Modulo
+        buf_len = 1 << max(0, int(self.wave_rate * self.wave_secs) - 1).bit_length()
         self.wave_buffer = np.zeros(buf_len, dtype=np.float32) if AUDIO_ANALYSIS_AVAILABLE else None
-        self.wave_write_idx = 0
-        self._lock = threading.Lock()
+        self.wave_write_idx = 0  # Fortlaufend, erst nach dem Schreiben veröffentlicht (SPSC, ohne Lock)
+        self._decim_phase = 0  # Versatz des nächsten Samples im folgenden Block
+
+        # Voller Takt nur für die FFT: zwei Blöcke, damit der Leser nie den gerade geschriebenen erwischt
+        self._block_ring = np.zeros(2 * self.block_size, dtype=np.float32) if AUDIO_ANALYSIS_AVAILABLE else None
+        self._block_write_idx = 0
+
+        # Spektrum rechnet ein eigener Thread, der Callback kopiert nur Samples
+        self._wave_ready = threading.Event()
+        self._worker = None
+        # Was die UI gerade anzeigt (set_mode): nur das wird im Callback/Worker berechnet
+        self.spectrum_needed = False
+        self.wave_needed = False
+
+        # Zähler für neue Daten: UI zeichnet nur, wenn sich seit dem letzten Frame etwas getan hat
+        self.block_id = 0  # RMS + Wave-Ringpuffer (Audio-Callback)
+        self.spectrum_id = 0  # self.spectrum (Analyse-Thread)
 
     def _callback(self, indata, frames, time_info, status):
         try:
@@ -95,47 +188,89 @@ class AudioAnalyzer:
                 right = indata[:, 1]
             else:
                 left = right = indata[:, 0]
-            # RMS
-            self.current_rms_l = float(np.sqrt(np.mean(left ** 2)))
-            self.current_rms_r = float(np.sqrt(np.mean(right ** 2)))
-
-            # FFT (Mono)
-            mono = (left + right) / 2.0
-
-            # --- Wellenform in Ringpuffer schreiben ---
-            if self.wave_buffer is not None:
-                with self._lock:
-                    n = len(mono)
-                    buf = self.wave_buffer
-                    L = buf.shape[0]
-                    i = self.wave_write_idx % L
-                    first = min(n, L - i)
-                    buf[i:i + first] = mono[:first]
-                    rest = n - first
-                    if rest > 0:
-                        buf[0:rest] = mono[first:first + rest]
-                    self.wave_write_idx = (i + n) % L
-
-            # Spektrum berechnen
-            fft = np.fft.rfft(mono)
-            magnitude = np.abs(fft)
-            num_bands = 20
-            band_size = max(1, len(magnitude) // num_bands)
-            bands = []
-            for i in range(num_bands):
-                start = i * band_size
-                end = start + band_size
-                bands.append(np.mean(magnitude[start:end]))
-            bands = np.array(bands)
-            maxv = np.max(bands)
-            if maxv > 0:
-                bands = bands / maxv
-            self.spectrum = bands
+            # RMS (Skalarprodukt statt left ** 2: kein temporäres Array)
+            self.current_rms_l = math.sqrt(float(np.dot(left, left)) / frames)
+            self.current_rms_r = math.sqrt(float(np.dot(right, right)) / frames) if self.channels == 2 else self.current_rms_l
+
+            # Mono-Mix
+            mono = self._mono[:frames]
+            np.add(left, right, out=mono)
+            mono *= 0.5
+
+            # --- Ringpuffer schreiben (Index jeweils zuletzt: Leser sehen nur fertige Blöcke) ---
+            # VU braucht nur RMS; Block-Ring nur fürs Spektrum, Wave-Ring nur für die Welle
+            if self.spectrum_needed:
+                self._block_write_idx = self._ring_write(self._block_ring, self._block_write_idx, mono)
+            if self.wave_needed:
+                dec = mono[self._decim_phase::self.wave_decim]
+                self.wave_write_idx = self._ring_write(self.wave_buffer, self.wave_write_idx, dec)
+            self._decim_phase = (self._decim_phase - frames) % self.wave_decim
+            self.block_id += 1
+            if self.spectrum_needed:
+                self._wave_ready.set()  # Worker nur wecken, wenn es etwas zu rechnen gibt
         except Exception:
             pass
 
+    def set_mode(self, style: str):
+        """Visualizer-Stil der UI übernehmen ('none', 'vu_meter', 'spectrum', 'wave')."""
+        self.spectrum_needed = style == 'spectrum'
+        self.wave_needed = style == 'wave'
+
+    def _analyze_loop(self):
+        """Worker: berechnet das Spektrum aus dem jeweils neuesten Block."""
+        while self.is_active:
+            # stop() weckt selbst; Timeout nur als Rückfallebene
+            if not self._wave_ready.wait(0.5):
+                continue
+            self._wave_ready.clear()
+            if not self.is_active:
+                break
+            # VU/Wave brauchen nur RMS bzw. Ringpuffer: FFT dann ganz auslassen
+            if not self.spectrum_needed:
+                continue
+            try:
+                self._compute_spectrum(self._ring_read(self._block_ring, self._block_write_idx, self.block_size))
+            except Exception:
+                pass
+
+    def _compute_spectrum(self, mono):
+        """Spektrum (num_bands Bänder, auf 0..1 normiert) nach self.spectrum schreiben."""
+        # float32-Eingang -> complex64 (scipy.fft, NumPy ab 2), das Ergebnis landet in float32-Puffern
+        fft = _rfft()(mono)
+        mag = self._ambm(fft.real, fft.imag)
+        # Alle Bänder in einem Schritt aufsummieren (Summe statt Mittel:
+        # der Faktor 1/band_size fällt bei der max-Normierung ohnehin heraus)
+        bands = self._bands
+        mag[:self.usable_bins].reshape(self.num_bands, self.band_size).sum(axis=1, out=bands)
+        maxv = bands.max()
+        if maxv > 0:
+            # Fertig normiert in den (ebenfalls festen) Ausgabepuffer schreiben
+            np.multiply(bands, 1.0 / maxv, out=self.spectrum)
+        else:
+            self.spectrum.fill(0.0)
+        self.spectrum_id += 1
+
+    def _ambm(self, re, im):
+        """Betrag |re + i*im| ohne Wurzel genähert (Alpha-Max-plus-Beta-Min, α=1, β=0.4).
+
+        Nur für die Anzeige: Fehler < 10 %, aber lineare Skala wie np.abs
+        (das Leistungsspektrum ließ leise Bänder fast verschwinden).
+        Ergebnis liegt in einem festen Puffer und wird beim nächsten Block überschrieben.
+        """
+        a = self._mag
+        b = self._mag_im
+        lo = self._mag_min
+        np.abs(re, out=a)
+        np.abs(im, out=b)
+        np.minimum(a, b, out=lo)
+        np.maximum(a, b, out=a)
+        lo *= 0.4
+        a += lo
+        return a
+
     def start(self, prefer_device_substr: str | None = None):
-        if not AUDIO_ANALYSIS_AVAILABLE:
+        sd = _sounddevice()
+        if sd is None:
             return
         try:
             devices = sd.query_devices()
@@ -164,10 +299,13 @@ class AudioAnalyzer:
                 channels=self.channels,
                 samplerate=self.sample_rate,
                 blocksize=self.block_size,
+                dtype='float32',  # passt zu Ring- und Arbeitspuffern, keine Umwandlung
                 callback=self._callback,
             )
             self.stream.start()
             self.is_active = True
+            self._worker = threading.Thread(target=self._analyze_loop, daemon=True)
+            self._worker.start()
             print(f"✅ Audio-Analyse gestartet (Device ID: {input_id})")
         except Exception as e:
             print(f"⚠️ Analyzer-Startfehler: {e}")
@@ -175,28 +313,57 @@ class AudioAnalyzer:
 
     def stop(self):
         self.is_active = False
+        self._wave_ready.set()  # Worker aufwecken, damit er sich beendet
         try:
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
         except Exception:
             pass
+        if self._worker is not None:
+            self._worker.join(timeout=0.5)
+            self._worker = None
 
     def get_recent_wave(self, n_samples: int) -> np.ndarray:
-        """Gibt die letzten n_samples Mono-Samples zurück (float32)."""
+        """Gibt die letzten n_samples Mono-Samples zurück (float32, Rate wave_rate).
+
+        Single-Producer ohne Lock: nur der Audio-Callback schreibt, UI und
+        Analyse-Thread lesen. Überholt der Callback die Kopie, ist höchstens
+        ein Block "zerrissen" – für die Anzeige unerheblich.
+        """
         if not AUDIO_ANALYSIS_AVAILABLE or self.wave_buffer is None:
             return np.zeros(max(1, n_samples), dtype=np.float32)
-        with self._lock:
-            buf = self.wave_buffer
-            L = buf.shape[0]
-            n = max(1, min(n_samples, L))
-            end = self.wave_write_idx % L
-            start = (end - n) % L
-            if start < end:
-                out = buf[start:end].copy()
-            else:
-                out = np.concatenate((buf[start:], buf[:end])).copy()
-        return out
+        return self._ring_read(self.wave_buffer, self.wave_write_idx, n_samples)
+
+    @staticmethod
+    def _ring_write(buf: np.ndarray, idx: int, data: np.ndarray) -> int:
+        """Schreibt data ab idx in den Ringpuffer, gibt den neuen (fortlaufenden) Schreibindex zurück.
+
+        Die Pufferlänge ist eine Zweierpotenz; idx läuft ohne Umbruch weiter
+        und wird erst beim Zugriff maskiert.
+        """
+        n = len(data)
+        L = buf.shape[0]
+        i = idx & (L - 1)
+        first = min(n, L - i)
+        # Gleicher dtype (float32) -> copyto kopiert direkt ohne Umwandlung
+        np.copyto(buf[i:i + first], data[:first], casting='no')
+        rest = n - first
+        if rest > 0:
+            np.copyto(buf[0:rest], data[first:first + rest], casting='no')
+        return idx + n
+
+    @staticmethod
+    def _ring_read(buf: np.ndarray, end: int, n_samples: int) -> np.ndarray:
+        """Kopie der letzten n_samples vor dem (einmal gelesenen) Schreibindex end."""
+        L = buf.shape[0]
+        mask = L - 1
+        n = max(1, min(n_samples, L))
+        start = (end - n) & mask
+        stop = end & mask
+        if start < stop:
+            return buf[start:stop].copy()
+        return np.concatenate((buf[start:], buf[:stop]))
 
 
 
@@ -214,6 +381,9 @@ class LoopbackManager:
         self.sink_name = "ctk_loop"
         self.target_sink = None  # pactl-Sinkname (z.B. als String)
         self.env_applied = False
+        # pactl-Ergebnisse zwischenspeichern (jeder Aufruf ist ein fork/exec)
+        self._default_sink_cache: str | None = None
+        self._sinks_cache: list[str] | None = None
 
     @staticmethod
     def _cmd_exists(cmd: str) -> bool:
@@ -221,14 +391,14 @@ class LoopbackManager:
 
     def _pactl(self, *args) -> tuple[int, str]:
         try:
-            out = subprocess.check_output(["pactl", *map(str, args)], text=True)
-            return 0, out
-        except subprocess.CalledProcessError as e:
-            return e.returncode, e.output or ""
+            res = subprocess.run(["pactl", *map(str, args)], capture_output=True, text=True, check=False)
+            return res.returncode, res.stdout
         except FileNotFoundError:
             return 127, "pactl not found"
 
-    def list_sinks(self) -> list[str]:
+    def list_sinks(self, refresh: bool = False) -> list[str]:
+        if self._sinks_cache is not None and not refresh:
+            return list(self._sinks_cache)
         rc, out = self._pactl("list", "short", "sinks")
         if rc != 0:
             return []
@@ -238,13 +408,63 @@ class LoopbackManager:
             parts = line.split("	")
             if len(parts) >= 2:
                 names.append(parts[1])
-        return names
+        self._sinks_cache = names
+        return list(names)
 
     def get_default_sink(self) -> str | None:
-        rc, out = self._pactl("get-default-sink")
-        if rc == 0:
-            return out.strip()
-        return None
+        if self._default_sink_cache is None:
+            rc, out = self._pactl("get-default-sink")
+            if rc == 0:
+                self._default_sink_cache = out.strip() or None
+        return self._default_sink_cache
+
+    def _find_modules(self) -> tuple[int | None, int | None]:
+        """Sucht bereits geladene Null-Senke/Loopback (z.B. nach Absturz) mit einem pactl-Aufruf."""
+        rc, out = self._pactl("list", "short", "modules")
+        if rc != 0:
+            return None, None
+        null_id = loop_id = None
+        # Format: index	name	argumente
+        for line in out.splitlines():
+            parts = line.split("	")
+            if len(parts) < 3:
+                continue
+            try:
+                mod_id = int(parts[0])
+            except ValueError:
+                continue
+            name, mod_args = parts[1], parts[2]
+            if name == "module-null-sink" and f"sink_name={self.sink_name}" in mod_args:
+                null_id = mod_id
+            elif (name == "module-loopback" and f"source={self.sink_name}.monitor" in mod_args
+                  and f"sink={self.target_sink}" in mod_args):
+                loop_id = mod_id
+        return null_id, loop_id
+
+    def _load_modules(self, modules: list[list[str]]) -> list[int | None]:
+        """Lädt pactl-Module der Reihe nach in einem Prozessstart, gibt die IDs zurück (None = Fehler)."""
+        if not modules:
+            return []
+        if len(modules) == 1:
+            rc, out = self._pactl("load-module", *modules[0])
+            try:
+                return [int(out.strip())] if rc == 0 else [None]
+            except ValueError:
+                return [None]
+        # Je Modul genau eine Ausgabezeile: ID oder "-" bei Fehler
+        script = "; ".join(f"{shlex.join(['pactl', 'load-module', *m])} || echo -" for m in modules)
+        try:
+            res = subprocess.run(["sh", "-c", script], capture_output=True, text=True, check=False)
+        except FileNotFoundError:
+            return [None] * len(modules)
+        lines = res.stdout.split()
+        ids: list[int | None] = []
+        for i in range(len(modules)):
+            try:
+                ids.append(int(lines[i]))
+            except (IndexError, ValueError):
+                ids.append(None)
+        return ids
 
     def setup(self, target_sink: str | None = None) -> bool:
         if not self._cmd_exists("pactl"):
@@ -252,30 +472,28 @@ class LoopbackManager:
             return False
         # gewünschte Zielsenke merken
         self.target_sink = target_sink or self.get_default_sink() or "@DEFAULT_SINK@"
-
-        # Null-Senke anlegen
-        rc, out = self._pactl("load-module", "module-null-sink",
-                              f"sink_name={self.sink_name}",
-                              "sink_properties=device.description=CTK_LoopSink")
-        if rc == 0:
-            try:
-                self.nullsink_id = int(out.strip())
-            except Exception:
-                self.nullsink_id = None
-        else:
+        self._sinks_cache = None  # Null-Senke ändert die Sink-Liste
+
+        # Vorhandene Module wiederverwenden statt erneut zu laden
+        existing_null, existing_loop = self._find_modules()
+
+        # Fehlende Module (Null-Senke, dann Loopback ctk_loop.monitor -> Ziel-Senke) laden
+        null_args = ["module-null-sink", f"sink_name={self.sink_name}",
+                     "sink_properties=device.description=CTK_LoopSink"]
+        loop_args = ["module-loopback", f"source={self.sink_name}.monitor",
+                     f"sink={self.target_sink}", "latency_msec=1"]
+        todo = []
+        if existing_null is None:
+            todo.append(null_args)
+        if existing_loop is None:
+            todo.append(loop_args)
+        loaded = iter(self._load_modules(todo))
+
+        self.nullsink_id = existing_null if existing_null is not None else next(loaded)
+        if self.nullsink_id is None:
             print("ℹ️ module-null-sink konnte nicht geladen werden (evtl. existiert schon).")
-
-        # Loopback von ctk_loop.monitor -> Ziel-Senke
-        rc, out = self._pactl("load-module", "module-loopback",
-                              f"source={self.sink_name}.monitor",
-                              f"sink={self.target_sink}",
-                              "latency_msec=1")
-        if rc == 0:
-            try:
-                self.loop_id = int(out.strip())
-            except Exception:
-                self.loop_id = None
-        else:
+        self.loop_id = existing_loop if existing_loop is not None else next(loaded)
+        if self.loop_id is None:
             print("⚠️ module-loopback konnte nicht geladen werden.")
 
         # VLC auf die Null-Senke umleiten
@@ -285,14 +503,11 @@ class LoopbackManager:
         return True
 
     def cleanup(self):
-        if self.loop_id is not None:
-            self._pactl("unload-module", str(self.loop_id))
-            self.loop_id = None
-        if self.nullsink_id is not None:
-            self._pactl("unload-module", str(self.nullsink_id))
-            self.nullsink_id = None
-
-    def cleanup(self):
+        # Nichts geladen oder kein pactl: gar keinen Prozess starten
+        if self.loop_id is None and self.nullsink_id is None:
+            return
+        if not self._cmd_exists("pactl"):
+            return
         # Reihenfolge: loopback zuerst, dann null-sink
         if self.loop_id is not None:
             self._pactl("unload-module", str(self.loop_id))
@@ -331,16 +546,52 @@ class AudioPlayerApp(ctk.CTk):
         self.player = self.vlc_instance.media_player_new()
         self.event_manager = self.player.event_manager()
         self.event_manager.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_song_end)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerPositionChanged, self._on_vlc_position)
 
         # State
         self.playlist: list[str] = []
+        self.basenames: list[str] = []  # Dateinamen parallel zu playlist
+        self.playlist_btns: list[ctk.CTkButton] = []  # Wiederverwendete Zeilen-Buttons
+        self.row_text: list[str] = []  # Aktuelle Beschriftung je Button
+        self.marked_index = None  # Zeile mit ▶-Markierung
         self.current_index = 0
         self.is_playing = False
         self.song_length = 0.0
+        self.total_time_str = "0:00"  # Formatierte Gesamtdauer, einmal pro Titel berechnet
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # Tag-Parsing abseits von Tk
+        self.load_token = 0  # Verwirft Längen überholter _load_song-Aufrufe
         self.is_seeking = False
         self.fullscreen = True
-        self.update_in_progress = False
+        self.pending_pos = None  # Letzte von VLC gemeldete Position (0..1), None = nichts Neues
+        self.progress_ticks = 0  # Zähler für den get_time()-Watchdog in _update_progress_loop
+        self.last_shown_sec = -1  # Zuletzt angezeigte Sekunde
+        self.last_prog_int = -1  # Zuletzt gesetztes ganzes Prozent des Sliders
         self.animation_tick = 0
+        self.anim_due = 0.0  # perf_counter-Zeitpunkt, zu dem der aktuelle Frame fällig war
+        self.eq_pending: dict[int, float] = {}  # Band -> noch nicht angewendeter Wert
+        self.eq_job = None  # after-ID des gebündelten EQ-Updates
+        self.vol_pending = None  # Noch nicht an VLC übergebene Lautstärke
+        self.audio_loop_running = False  # _process_audio_loop aktiv eingeplant
+        self.viz_key = None  # (Stil, Breite, Höhe, ...) der angelegten Canvas-Items
+        self.viz_items = None
+        self.viz_cache: dict[str, tuple] = {}  # Stil -> (key, items), ausgeblendet wenn inaktiv
+        self.viz_drawn_id = None  # Analyzer-Zähler des zuletzt gezeichneten Frames
+        # Wellenform-Arbeitspuffer, nur bei Breiten-/Längenwechsel neu angelegt
+        self.wave_pts_key = None  # (num_points, Breite)
+        self.wave_pts = None  # x/y verschachtelt, x fest vorbelegt
+        self.wave_interp_mode = 'hermite'  # 'hermite' (kubisch, 4 Stützstellen) oder 'linear'
+        self.wave_interp_key = None  # (Modus, Anzahl Samples, num_points)
+        self.wave_xp = None
+        self.wave_idx = None
+        self.wave_taps = None  # Hermite: 4 x num_points Indizes, Gewichte und Sammelpuffer
+        self.wave_weights = None
+        self.wave_gather = None
+        self.wave_out = None
+        self.window_visible = True  # False solange das Fenster minimiert/ausgeblendet ist
+        self.sinks_cache: list[str] | None = None  # Sink-Liste für den Einstellungsdialog
+        self.sinks_cache_ts = 0.0  # time.monotonic() der letzten Abfrage
+        self.viz_w = 800  # Canvas-Größe, per <Configure> aktualisiert
+        self.viz_h = 56
 
         # Shuffle
         self.shuffle_mode = False
@@ -350,11 +601,13 @@ class AudioPlayerApp(ctk.CTk):
         # Visualizer
         self.visualizer_styles = ['none', 'vu_meter', 'spectrum', 'wave']
         self.current_visualizer = args.visualizer if args.visualizer in self.visualizer_styles else 'none'
+        self.viz_idx = self.visualizer_styles.index(self.current_visualizer)  # Position in visualizer_styles
 
         # Analyzer (nur wenn Visualizer aktiv)
         self.analyzer = None
         if self.current_visualizer != 'none' and AUDIO_ANALYSIS_AVAILABLE:
             self.analyzer = AudioAnalyzer(auto_loopback=bool(self.loopback))
+            self.analyzer.set_mode(self.current_visualizer)
             prefer = self.config.get("analyzer_input") or (f"{self.loopback.sink_name}.monitor" if self.loopback else None)
             self.analyzer.start(prefer_device_substr=prefer)
 
@@ -364,6 +617,8 @@ class AudioPlayerApp(ctk.CTk):
 
         # Favoriten
         self.favorites = self._load_favorites()
+        self.fav_dirty = False  # Favoriten geändert, noch nicht gespeichert
+        self.fav_job = None  # after-ID des verzögerten Speicherns
 
         self.music_folder = args.folder if args.folder else str(Path.home() / "Music")
         self.autoplay = args.autoplay
@@ -387,9 +642,15 @@ class AudioPlayerApp(ctk.CTk):
 
     # ---------- UI ----------
     def _build_ui(self):
+        # Gemeinsame Schriften (ein Tk-Font je Größe statt einer pro Label)
+        self.font_title = ctk.CTkFont(size=18, weight="bold")
+        self.font_icon = ctk.CTkFont(size=14, weight="bold")
+        self.font_header = ctk.CTkFont(size=13, weight="bold")
+
         # Top: Visualizer
         self.viz_canvas = ctk.CTkCanvas(self, height=56, bg="#111111", highlightthickness=1, highlightbackground="#333333")
         self.viz_canvas.pack(fill="x", padx=8, pady=(8, 4))
+        self.viz_canvas.bind("<Configure>", self._on_viz_configure, add="+")
 
         # Visualizer-Info + Theme-Schalter
         top_bar = ctk.CTkFrame(self)
@@ -404,7 +665,7 @@ class AudioPlayerApp(ctk.CTk):
         # Titel + Favorit
         title_row = ctk.CTkFrame(self)
         title_row.pack(fill="x")
-        self.title_label = ctk.CTkLabel(title_row, text="Kein Titel geladen", font=ctk.CTkFont(size=18, weight="bold"))
+        self.title_label = ctk.CTkLabel(title_row, text="Kein Titel geladen", font=self.font_title)
         self.title_label.pack(side="left", pady=(6, 2), padx=10)
         self.fav_btn = ctk.CTkButton(title_row, text="☆", width=42, command=self._toggle_favorite)
         self.fav_btn.pack(side="right", padx=10)
@@ -464,7 +725,7 @@ class AudioPlayerApp(ctk.CTk):
         # Lautstärke
         vol = ctk.CTkFrame(bottom)
         vol.pack(side="left", fill="y", padx=6)
-        ctk.CTkLabel(vol, text="🔊", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(6, 2))
+        ctk.CTkLabel(vol, text="🔊", font=self.font_icon).pack(pady=(6, 2))
         vrow = ctk.CTkFrame(vol)
         vrow.pack(pady=6)
         ctk.CTkButton(vrow, text="−", width=40, command=lambda: self._adjust_volume(-10)).pack(side="left", padx=4)
@@ -476,14 +737,14 @@ class AudioPlayerApp(ctk.CTk):
         # Playlist (ScrollableFrame)
         playlist_frame = ctk.CTkFrame(bottom)
         playlist_frame.pack(side="left", fill="both", expand=True, padx=6)
-        ctk.CTkLabel(playlist_frame, text="📋 Playlist", font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=8, pady=(8, 4))
+        ctk.CTkLabel(playlist_frame, text="📋 Playlist", font=self.font_header).pack(anchor="w", padx=8, pady=(8, 4))
         self.playlist_sf = ctk.CTkScrollableFrame(playlist_frame, height=200)
         self.playlist_sf.pack(fill="both", expand=True, padx=6, pady=(0, 8))
 
         # Equalizer
         eq = ctk.CTkFrame(bottom)
         eq.pack(side="left", fill="y", padx=6)
-        ctk.CTkLabel(eq, text="🎛️ Equalizer", font=ctk.CTkFont(size=13, weight="bold")).pack(pady=(8, 4))
+        ctk.CTkLabel(eq, text="🎛️ Equalizer", font=self.font_header).pack(pady=(8, 4))
         # Presets
         preset_row = ctk.CTkFrame(eq)
         preset_row.pack(pady=(0, 6))
@@ -502,13 +763,12 @@ class AudioPlayerApp(ctk.CTk):
         cols = ctk.CTkFrame(eq)
         cols.pack(pady=4)
         for i, lab in enumerate(eq_labels):
-            col = ctk.CTkFrame(cols)
-            col.grid(row=0, column=i, padx=2)
-            ctk.CTkLabel(col, text=lab).pack()
-            s = ctk.CTkSlider(col, from_=20, to=-20, orientation="vertical", height=120, number_of_steps=80,
+            # Label und Slider direkt ins Raster, ohne eigenen Frame pro Band
+            ctk.CTkLabel(cols, text=lab).grid(row=0, column=i, padx=2)
+            s = ctk.CTkSlider(cols, from_=20, to=-20, orientation="vertical", height=120, number_of_steps=80,
                                command=lambda val, idx=i: self._on_eq_change(idx, val))
             s.set(0)
-            s.pack()
+            s.grid(row=1, column=i, padx=2)
             self.eq_sliders.append(s)
 
         # Shortcuts
@@ -530,6 +790,9 @@ class AudioPlayerApp(ctk.CTk):
         self.bind('q', lambda e: self._quit())
         self.bind('Q', lambda e: self._quit())
         self.bind('<Escape>', lambda e: self._quit())
+        # Fenster minimiert/wiederhergestellt (Events der Kind-Widgets ignorieren)
+        self.bind('<Map>', lambda e: self._on_window_map(e, True))
+        self.bind('<Unmap>', lambda e: self._on_window_map(e, False))
 
     # ---------- Theme ----------
     def _on_theme_change(self, value: str):
@@ -558,7 +821,8 @@ class AudioPlayerApp(ctk.CTk):
 
     # ---------- Device Helpers ----------
     def _list_input_devices(self) -> list[str]:
-        if not AUDIO_ANALYSIS_AVAILABLE:
+        sd = _sounddevice()
+        if sd is None:
             return []
         try:
             devs = sd.query_devices()
@@ -586,10 +850,15 @@ class AudioPlayerApp(ctk.CTk):
         auto_cb = ctk.CTkCheckBox(win, text="Auto-Loopback beim Start aktivieren", variable=auto_var)
         auto_cb.pack(anchor="w", padx=12, pady=(12, 6))
 
-        # Sinks laden
-        sinks = []
-        if self.loopback or LoopbackManager._cmd_exists("pactl"):
-            sinks = (self.loopback.list_sinks() if self.loopback else LoopbackManager().list_sinks()) or []
+        # Sinks laden (pactl ist auf dem Pi langsam: Ergebnis einige Sekunden wiederverwenden)
+        now = time.monotonic()
+        if self.sinks_cache is None or now - self.sinks_cache_ts > 5.0:
+            sinks = []
+            if self.loopback or LoopbackManager._cmd_exists("pactl"):
+                sinks = (self.loopback.list_sinks() if self.loopback else LoopbackManager().list_sinks()) or []
+            self.sinks_cache = sinks
+            self.sinks_cache_ts = now
+        sinks = list(self.sinks_cache)
         sinks_display = sinks if sinks else ["(keine gefunden)"]
         current_target = self.config.get("target_sink") or (self.loopback.target_sink if self.loopback else "") or ""
 
@@ -641,6 +910,7 @@ class AudioPlayerApp(ctk.CTk):
             else:
                 self.config.pop("analyzer_input", None)
             self._save_config()
+            self.sinks_cache = None  # Loopback-Umbau kann die Sink-Liste ändern
             # Live anwenden
             try:
                 # Loopback an-/abschalten
@@ -658,6 +928,7 @@ class AudioPlayerApp(ctk.CTk):
                         self.analyzer.stop()
                     else:
                         self.analyzer = AudioAnalyzer(auto_loopback=bool(self.loopback))
+                    self.analyzer.set_mode(self.current_visualizer)
                     prefer = self.config.get("analyzer_input") or (f"{self.loopback.sink_name}.monitor" if self.loopback else None)
                     if self.current_visualizer != 'none':
                         self.analyzer.start(prefer_device_substr=prefer)
@@ -671,17 +942,38 @@ class AudioPlayerApp(ctk.CTk):
     def _clear_playlist_ui(self):
         for child in self.playlist_sf.winfo_children():
             child.destroy()
+        self.playlist_btns = []
+        self.row_text = []
+        self.marked_index = None
 
     def _populate_playlist_ui(self):
-        self._clear_playlist_ui()
-        for i, path in enumerate(self.playlist):
-            filename = os.path.basename(path)
-            is_fav = path in self.favorites
-            star = "★ " if is_fav else ""
-            prefix = "▶ " if i == self.current_index else "   "
-            btn = ctk.CTkButton(self.playlist_sf, text=f"{prefix}{star}{filename}", anchor="w", height=32,
-                                 command=lambda idx=i: self._on_playlist_click(idx))
+        """Gleicht den Button-Pool an die Playlist an (nur bei geänderter Playlist nötig)."""
+        n = len(self.playlist)
+        # Überzählige Buttons entfernen, fehlende anlegen – vorhandene nur umbeschriften
+        while len(self.playlist_btns) > n:
+            self.playlist_btns.pop().destroy()
+            self.row_text.pop()
+        for i in range(len(self.playlist_btns), n):
+            btn = ctk.CTkButton(self.playlist_sf, text="", anchor="w", height=32,
+                                command=lambda idx=i: self._on_playlist_click(idx))
             btn.pack(fill="x", padx=4, pady=2)
+            self.playlist_btns.append(btn)
+            self.row_text.append("")
+        for i in range(n):
+            self._update_row(i)
+        self.marked_index = self.current_index if n else None
+
+    def _format_row(self, i: int) -> str:
+        star = "★ " if self.playlist[i] in self.favorites else ""
+        prefix = "▶ " if i == self.current_index else "   "
+        return f"{prefix}{star}{self.basenames[i]}"
+
+    def _update_row(self, i: int):
+        # Nur konfigurieren wenn sich die Beschriftung wirklich ändert
+        text = self._format_row(i)
+        if text != self.row_text[i]:
+            self.row_text[i] = text
+            self.playlist_btns[i].configure(text=text)
 
     def _on_playlist_click(self, index: int):
         self._load_song(index)
@@ -699,11 +991,20 @@ class AudioPlayerApp(ctk.CTk):
         return set()
 
     def _save_favorites(self):
+        # Erst in Temp-Datei schreiben, dann atomar ersetzen (kein halbes JSON bei Stromausfall)
         try:
-            FAV_PATH.write_text(json.dumps(sorted(self.favorites)), encoding='utf-8')
+            tmp = FAV_PATH.with_suffix('.json.tmp')
+            tmp.write_text(json.dumps(sorted(self.favorites)), encoding='utf-8')
+            os.replace(tmp, FAV_PATH)
         except Exception:
             pass
 
+    def _flush_favorites(self):
+        self.fav_job = None
+        if self.fav_dirty:
+            self.fav_dirty = False
+            self._save_favorites()
+
     def _toggle_favorite(self):
         path = self.playlist[self.current_index] if self.playlist else None
         if not path:
@@ -712,7 +1013,10 @@ class AudioPlayerApp(ctk.CTk):
             self.favorites.remove(path)
         else:
             self.favorites.add(path)
-        self._save_favorites()
+        # Schnelles Mehrfach-Umschalten zu einem Schreibvorgang bündeln
+        self.fav_dirty = True
+        if self.fav_job is None:
+            self.fav_job = self.after(500, self._flush_favorites)
         self._refresh_fav_ui()
 
     def _refresh_fav_ui(self):
@@ -722,8 +1026,13 @@ class AudioPlayerApp(ctk.CTk):
             self.fav_btn.configure(text="★")
         else:
             self.fav_btn.configure(text="☆")
-        # Liste neu beschriften
-        self._populate_playlist_ui()
+        # Nur die bisher markierte und die aktuelle Zeile neu beschriften
+        old = self.marked_index
+        if old is not None and old != self.current_index and old < len(self.playlist_btns):
+            self._update_row(old)
+        if self.current_index < len(self.playlist_btns):
+            self._update_row(self.current_index)
+            self.marked_index = self.current_index
 
     # ---------- Equalizer ----------
     def _setup_equalizer(self):
@@ -736,9 +1045,18 @@ class AudioPlayerApp(ctk.CTk):
             self.equalizer = None
 
     def _on_eq_change(self, band_index: int, value):
+        # Slider feuern pro Pixel: nur merken, gebündelt in _flush_eq anwenden
+        self.eq_pending[band_index] = float(value)
+        if self.eq_job is None:
+            self.eq_job = self.after(30, self._flush_eq)
+
+    def _flush_eq(self):
+        self.eq_job = None
+        pending, self.eq_pending = self.eq_pending, {}
         try:
-            if self.equalizer:
-                vlc.libvlc_audio_equalizer_set_amp_at_index(self.equalizer, float(value), band_index)
+            if self.equalizer and pending:
+                for band_index, value in pending.items():
+                    vlc.libvlc_audio_equalizer_set_amp_at_index(self.equalizer, value, band_index)
                 vlc.libvlc_media_player_set_equalizer(self.player, self.equalizer)
         except Exception as e:
             print(f"EQ Error: {e}")
@@ -768,10 +1086,12 @@ class AudioPlayerApp(ctk.CTk):
         files = fd.askopenfilenames(title="Audiodateien hinzufügen",
                                     filetypes=[("Audio", "*.mp3 *.wav *.ogg *.flac *.m4a *.aac *.wma")])
         if files:
-            # Hänge an Playlist an (duplikate vermeiden)
-            add = [f for f in files if f.lower().endswith(AUDIO_EXT) and f not in self.playlist]
+            # Hänge an Playlist an (duplikate vermeiden, Set statt Listensuche)
+            existing = set(self.playlist)
+            add = [f for f in files if os.path.splitext(f)[1].lower() in AUDIO_EXT_SET and f not in existing]
             if add:
                 self.playlist.extend(add)
+                self.basenames.extend(os.path.basename(f) for f in add)
                 self._populate_playlist_ui()
 
     def _load_folder(self, folder_path: str):
@@ -779,8 +1099,9 @@ class AudioPlayerApp(ctk.CTk):
             self.title_label.configure(text=f"Ordner nicht gefunden: {folder_path}")
             return
         try:
-            files = [os.path.join(folder_path, f) for f in sorted(os.listdir(folder_path)) if f.lower().endswith(AUDIO_EXT)]
+            files = self._scan_audio(folder_path)
             self.playlist = files
+            self.basenames = [os.path.basename(p) for p in files]
             if self.playlist:
                 self.current_index = 0
                 self._build_shuffled_order()
@@ -814,11 +1135,11 @@ class AudioPlayerApp(ctk.CTk):
             return
         order = list(range(n))
         if self.shuffle_mode:
-            order = random.sample(order, n)
-            if start_from_current and self.current_index in order:
-                # Stelle sicher, dass aktueller Index an aktueller Position steht
-                order.remove(self.current_index)
-                order.insert(0, self.current_index)
+            random.shuffle(order)
+            if start_from_current and 0 <= self.current_index < n:
+                # Stelle sicher, dass aktueller Index an aktueller Position steht (ein Tausch statt remove/insert)
+                j = order.index(self.current_index)
+                order[0], order[j] = order[j], order[0]
                 self.shuf_pos = 0
         else:
             self.shuf_pos = self.current_index
@@ -857,17 +1178,29 @@ class AudioPlayerApp(ctk.CTk):
                 # Schuffle-Pos aktualisieren
                 if self.shuffle_mode and self.current_index in self.shuffled_order:
                     self.shuf_pos = self.shuffled_order.index(self.current_index)
-                filename = os.path.basename(path)
-                self.title_label.configure(text=filename)
-                self._populate_playlist_ui()
+                self.title_label.configure(text=self.basenames[index])
                 self._refresh_fav_ui()
-                self.song_length = self._probe_length(path)
-                self.total_time_label.configure(text=self._fmt_time(self.song_length))
+                # Länge im Hintergrund ermitteln (mutagen liest die Datei), Anzeige folgt
+                self.song_length = 0.0
+                self.total_time_label.configure(text="…")
+                self.load_token += 1
+                token = self.load_token
+                future = self.io_pool.submit(self._probe_length, path)
+                future.add_done_callback(lambda f: self.after(0, self._apply_length, token, f))
                 self.current_time_label.configure(text="0:00")
                 self.progress_slider.set(0)
+                self._reset_progress_cache()
             except Exception as e:
                 self.title_label.configure(text=f"Fehler: {e}")
 
+    def _apply_length(self, token: int, future):
+        if token != self.load_token:
+            return
+        self.song_length = future.result()
+        self.total_time_str = self._fmt_time(self.song_length)
+        self.total_time_label.configure(text=self.total_time_str)
+        self._reset_progress_cache()
+
     def _play(self):
         try:
             self.player.play()
@@ -911,12 +1244,22 @@ class AudioPlayerApp(ctk.CTk):
                 current = self.player.get_time() / 1000.0
                 new_pos = max(0.0, min(current + seconds, self.song_length))
                 self.player.set_time(int(new_pos * 1000))
+                self._reset_progress_cache()
             except Exception:
                 pass
 
     def _on_volume(self, val):
+        # Beim Ziehen nur den letzten Wert merken, VLC einmal pro Idle-Runde setzen
+        pending = self.vol_pending
+        self.vol_pending = int(float(val))
+        if pending is None:
+            self.after_idle(self._apply_volume)
+
+    def _apply_volume(self):
+        vol, self.vol_pending = self.vol_pending, None
         try:
-            self.player.audio_set_volume(int(float(val)))
+            if vol is not None:
+                self.player.audio_set_volume(vol)
         except Exception:
             pass
 
@@ -961,72 +1304,161 @@ class AudioPlayerApp(ctk.CTk):
                 self.player.set_time(int(position * 1000))
             except Exception:
                 pass
+        self._reset_progress_cache()
         self.is_seeking = False
 
     def _on_seek_drag(self, _val):
         if self.is_seeking and self.song_length > 0:
             cur = (float(self.progress_slider.get()) / 100.0) * self.song_length
-            self.current_time_label.configure(text=self._fmt_time(cur))
+            # Beim Ziehen nur bei neuer Sekunde neu beschriften
+            sec = int(cur)
+            if sec != self.last_shown_sec:
+                self.last_shown_sec = sec
+                self.current_time_label.configure(text=self._fmt_time(cur))
 
     # ---------- Loops ----------
+    def _on_vlc_position(self, event):
+        # Läuft im VLC-Thread: nur Wert merken, kein Tk-Aufruf. after()/after_idle würden
+        # hier blockieren, während der Tk-Thread in set_media()/stop() auf diesen Thread wartet.
+        self.pending_pos = event.u.new_position
+
+    def _show_position(self, pos: float):
+        if not 0 <= pos <= self.song_length:
+            return
+        # Slider nur bei neuem ganzen Prozent, Label nur bei neuer Sekunde schreiben
+        progress = (pos / self.song_length) * 100.0
+        prog_int = int(progress)
+        if prog_int != self.last_prog_int:
+            self.last_prog_int = prog_int
+            self.progress_slider.set(progress)
+        sec = int(pos)
+        if sec != self.last_shown_sec:
+            self.last_shown_sec = sec
+            self.current_time_label.configure(text=self._fmt_time(pos))
+
+    def _reset_progress_cache(self):
+        # Nach Laden/Seek: nächste Position auf jeden Fall anzeigen
+        self.last_shown_sec = -1
+        self.last_prog_int = -1
+        self.pending_pos = None  # Position des alten Titels bzw. vor dem Sprung verwerfen
+
     def _update_progress_loop(self):
-        if self.is_playing and not self.is_seeking and self.song_length > 0 and not self.update_in_progress:
-            self.update_in_progress = True
-            try:
-                pos_ms = self.player.get_time()
-                if pos_ms >= 0:
-                    pos = pos_ms / 1000.0
-                    if pos <= self.song_length:
-                        progress = (pos / self.song_length) * 100.0
-                        self.progress_slider.set(progress)
-                        self.current_time_label.configure(text=self._fmt_time(pos))
-            except Exception:
-                pass
-            finally:
-                self.update_in_progress = False
-        self.after(500, self._update_progress_loop)
+        # Holt die von _on_vlc_position gemerkte Position ab; alle 2 s zusätzlich
+        # get_time() als Watchdog, falls VLC keine Positions-Events liefert
+        pos, self.pending_pos = self.pending_pos, None
+        self.progress_ticks = (self.progress_ticks + 1) % 8
+        if self.is_playing and not self.is_seeking and self.song_length > 0:
+            if pos is not None:
+                self._show_position(pos * self.song_length)
+            elif self.progress_ticks == 0:
+                try:
+                    pos_ms = self.player.get_time()
+                    if pos_ms >= 0:
+                        self._show_position(pos_ms / 1000.0)
+                except Exception:
+                    pass
+        self.after(250, self._update_progress_loop)
 
     def _process_audio_loop(self):
+        # Ohne Analyzer bzw. bei Visualizer 'none' gar nicht erst weitertakten
+        if not self.analyzer or self.current_visualizer == 'none':
+            self.audio_loop_running = False
+            return
+        self.audio_loop_running = True
         try:
-            if self.analyzer and self.analyzer.is_active:
+            if self.analyzer.is_active:
                 pass
         except Exception:
             pass
         self.after(100, self._process_audio_loop)
 
+    def _on_window_map(self, event, visible: bool):
+        if event.widget is self:
+            self.window_visible = visible
+
+    def _on_viz_configure(self, event):
+        # Größe nur bei Änderung abfragen statt in jedem Frame
+        self.viz_w = event.width or 800
+        self.viz_h = int(self.viz_canvas.cget("height")) or 56
+
     def _animation_loop(self):
+        # Fenster minimiert oder Canvas nicht sichtbar: nichts zeichnen, nur selten nachsehen
+        if not self.window_visible or not self.viz_canvas.winfo_viewable():
+            self.after(500, self._animation_loop)
+            return
+        mode = self.current_visualizer
         try:
-            self.viz_canvas.delete("all")
-            width = self.viz_canvas.winfo_width() or 800
-            height = int(self.viz_canvas.cget("height")) or 56
-            if self.current_visualizer == 'none':
+            width = self.viz_w
+            height = self.viz_h
+            if mode == 'none':
                 text = "▶ SPIELT" if self.is_playing else "⏸ PAUSE"
                 color = "#27ae60" if self.is_playing else "#95a5a6"
-                self.viz_canvas.create_text(width // 2, height // 2, text=text, fill=color, font=("Arial", 14, "bold"))
-                self.after(500, self._animation_loop)
-                return
-            if not self.is_playing:
-                self.viz_canvas.create_text(width // 2, height // 2, text="⏸ PAUSIERT", fill="#95a5a6", font=("Arial", 12, "bold"))
-                self.after(120, self._animation_loop)
-                return
-            if self.current_visualizer == 'vu_meter':
+                self._draw_status(width, height, text, color, 14)
+            elif not self.is_playing:
+                mode = 'paused'
+                self._draw_status(width, height, "⏸ PAUSIERT", "#95a5a6", 12)
+            elif mode == 'vu_meter':
                 self._draw_vu(width, height)
-            elif self.current_visualizer == 'spectrum':
+            elif mode == 'spectrum':
                 self._draw_spectrum(width, height)
             else:
                 self._draw_wave(width, height)
         except Exception:
             pass
-        self.after(100, self._animation_loop)
+        # Fester Takt: nächster Frame ein Intervall nach dem letzten Soll-Zeitpunkt, so
+        # gleichen sich Zeichenzeit und after()-Verspätung aus. Mehr als ein Frame im
+        # Rückstand: Frames auslassen und ab jetzt neu takten statt aufzuholen.
+        period = 1.0 / VIZ_TARGET_FPS.get(mode, 10)
+        now = time.perf_counter()
+        due = self.anim_due + period
+        if due < now - period:
+            due = now + period
+        self.anim_due = due
+        # Mindestens 5 ms, damit Eingaben und Layout zwischen zwei Frames drankommen
+        self.after(max(5, int((due - now) * 1000)), self._animation_loop)
+
+    def _viz_layout(self, key, build):
+        """Canvas-Items für key nur einmal anlegen; neu nur bei Größenwechsel.
+
+        Bei Stilwechsel werden die Items des alten Stils nur ausgeblendet und beim
+        Zurückschalten wieder eingeblendet (Tag = Stilname).
+        """
+        if key != self.viz_key:
+            canvas = self.viz_canvas
+            style = key[0]
+            if self.viz_key is not None and self.viz_key[0] != style:
+                canvas.itemconfigure(self.viz_key[0], state='hidden')
+            cached = self.viz_cache.get(style)
+            if cached is not None and cached[0] == key:
+                self.viz_items = cached[1]
+                canvas.itemconfigure(style, state='normal')
+            else:
+                canvas.delete(style)
+                self.viz_items = build()
+                # Neu angelegte (noch ungetaggte) Items dem Stil zuordnen
+                canvas.addtag_withtag(style, '!viz')
+                canvas.addtag_withtag('viz', style)
+                self.viz_cache[style] = (key, self.viz_items)
+            self.viz_key = key
+            self.viz_drawn_id = None
+        return self.viz_items
+
+    def _viz_unchanged(self, frame_id: int) -> bool:
+        """True, wenn der Analyzer seit dem letzten gezeichneten Frame nichts Neues geliefert hat."""
+        if frame_id == self.viz_drawn_id:
+            return True
+        self.viz_drawn_id = frame_id
+        return False
+
+    def _draw_status(self, width: int, height: int, text: str, color: str, size: int):
+        item = self._viz_layout(('status', width, height), lambda: self.viz_canvas.create_text(width // 2, height // 2))
+        self.viz_canvas.itemconfigure(item, text=text, fill=color, font=("Arial", size, "bold"))
 
     # ---------- Visualizer ----------
     def _cycle_visualizer(self):
-        # zirkulär weiterdrehen
-        if self.current_visualizer not in self.visualizer_styles:
-            self.current_visualizer = self.visualizer_styles[0]
-
-        idx = (self.visualizer_styles.index(self.current_visualizer) + 1) % len(self.visualizer_styles)
-        self.current_visualizer = self.visualizer_styles[idx]
+        # zirkulär weiterdrehen (Index mitführen statt per index() suchen)
+        self.viz_idx = (self.viz_idx + 1) % len(self.visualizer_styles)
+        self.current_visualizer = self.visualizer_styles[self.viz_idx]
 
         # Label aktualisieren
         self.viz_label.configure(text=f"📊 {self.current_visualizer.upper()}  |  'V' wechseln")
@@ -1043,89 +1475,138 @@ class AudioPlayerApp(ctk.CTk):
             if AUDIO_ANALYSIS_AVAILABLE:
                 if not self.analyzer:
                     self.analyzer = AudioAnalyzer(auto_loopback=bool(self.loopback))
-                if not getattr(self.analyzer, "is_active", False):
+                self.analyzer.set_mode(self.current_visualizer)
+                if not self.analyzer.is_active:
                     prefer = self.config.get("analyzer_input") or (
                         f"{self.loopback.sink_name}.monitor" if self.loopback else None
                     )
                     self.analyzer.start(prefer_device_substr=prefer)
+                if not self.audio_loop_running:
+                    self._process_audio_loop()
 
 
     def _draw_vu(self, width: int, height: int):
-        if self.analyzer and AUDIO_ANALYSIS_AVAILABLE:
+        canvas = self.viz_canvas
+        bar_w = width // 2 - 60
+        bar_h = 18
+        y0 = (height - bar_h * 2 - 6) // 2
+        x = 30
+
+        def build():
+            fills = []
+            for y, label in ((y0, 'L'), (y0 + bar_h + 6, 'R')):
+                canvas.create_rectangle(x, y, x + bar_w, y + bar_h, fill='#0a0a0a', outline='#333333')
+                fills.append(canvas.create_rectangle(x + 2, y + 2, x + 2, y + bar_h - 2, outline=''))
+                canvas.create_text(x - 10, y + bar_h // 2, text=label, fill='white', font=('Arial', 10, 'bold'), anchor='e')
+            return fills, [None, None]
+
+        fills, colors = self._viz_layout(('vu_meter', width, height), build)
+        if self.analyzer and AUDIO_ANALYSIS_AVAILABLE and self.analyzer.is_active:
+            if self._viz_unchanged(self.analyzer.block_id):
+                return
             level_l = min(self.analyzer.current_rms_l * 3.0, 1.0)
             level_r = min(self.analyzer.current_rms_r * 3.0, 1.0)
         else:
             self.animation_tick += 1
-            level_l = abs(math.sin(self.animation_tick * 0.08)) * 0.7 + 0.1
-            level_r = abs(math.sin(self.animation_tick * 0.10 + 1)) * 0.65 + 0.15
-        bar_w = width // 2 - 60
-        bar_h = 18
-        y0 = (height - bar_h * 2 - 6) // 2
-        def draw_bar(x, y, lvl, label):
-            self.viz_canvas.create_rectangle(x, y, x + bar_w, y + bar_h, fill='#0a0a0a', outline='#333333')
+            level_l = abs(_sin_lut(self.animation_tick * 0.08)) * 0.7 + 0.1
+            level_r = abs(_sin_lut(self.animation_tick * 0.10 + 1)) * 0.65 + 0.15
+        for i, (y, lvl) in enumerate(((y0, level_l), (y0 + bar_h + 6, level_r))):
             fill_w = int(bar_w * lvl)
-            color = '#27ae60' if lvl < 0.7 else ('#f39c12' if lvl < 0.85 else '#e74c3c')
-            self.viz_canvas.create_rectangle(x + 2, y + 2, x + max(2, fill_w) - 2, y + bar_h - 2, fill=color, outline='')
-            self.viz_canvas.create_text(x - 10, y + bar_h // 2, text=label, fill='white', font=('Arial', 10, 'bold'), anchor='e')
-        draw_bar(30, y0, level_l, 'L')
-        draw_bar(30, y0 + bar_h + 6, level_r, 'R')
+            canvas.coords(fills[i], x + 2, y + 2, x + max(2, fill_w) - 2, y + bar_h - 2)
+            bucket = (lvl >= 0.7) + (lvl >= 0.85)
+            if bucket != colors[i]:
+                colors[i] = bucket
+                canvas.itemconfigure(fills[i], fill=VU_COLORS[bucket])
 
     def _draw_spectrum(self, width: int, height: int):
-        if self.analyzer and AUDIO_ANALYSIS_AVAILABLE and self.analyzer.spectrum is not None:
+        if self.analyzer and AUDIO_ANALYSIS_AVAILABLE and self.analyzer.is_active and self.analyzer.spectrum is not None:
             spec = self.analyzer.spectrum
             n = len(spec)
+            frame_id = self.analyzer.spectrum_id
         else:
             n = 16
+            frame_id = None
             self.animation_tick += 1
-            spec = [abs(math.sin((i * 0.5 + self.animation_tick * 0.1))) * 0.8 + 0.2 for i in range(n)]
+            spec = [abs(_sin_lut(i * 0.5 + self.animation_tick * 0.1)) * 0.8 + 0.2 for i in range(n)]
+        canvas = self.viz_canvas
         xpad = 22
         bar_w = (width - xpad * 2) / n
-        for i in range(n):
-            a = spec[i] if i < len(spec) else 0
-            bh = int(height * a * 0.8)
-            x = xpad + i * bar_w
-            y = height - bh - 6
-            color = '#3498db' if a < 0.4 else ('#9b59b6' if a < 0.7 else '#e74c3c')
-            self.viz_canvas.create_rectangle(x + 1, y, x + bar_w - 1, height - 6, fill=color, outline='')
+        base = height - 6
+
+        def build():
+            # Ein Polygon je Farbstufe statt ein Rechteck je Balken: 3 Items, 3 coords() pro Frame
+            polys = [canvas.create_polygon(0, base, 0, base, 0, base, fill=c, outline='') for c in SPEC_COLORS]
+            xs = [(xpad + i * bar_w + 1, xpad + (i + 1) * bar_w - 1) for i in range(n)]
+            return polys, xs
+
+        polys, xs = self._viz_layout(('spectrum', width, height, n), build)
+        if frame_id is not None:
+            if self._viz_unchanged(frame_id):
+                return
+            # Einmal als Python-Floats kopieren: stabile Momentaufnahme, Vergleiche ergeben echte bools
+            spec = spec.tolist()
+        pts = ([], [], [])
+        for (x0, x1), a in zip(xs, spec):
+            y = base - int(height * a * 0.8)
+            # Balken als Säule auf der Grundlinie; Nachbarn hängen über die (leere) Grundlinie zusammen
+            pts[(a >= 0.4) + (a >= 0.7)].extend((x0, base, x0, y, x1, y, x1, base))
+        for poly, p in zip(polys, pts):
+            # Leere Stufe: entartetes Dreieck (Tk braucht mindestens 3 Punkte)
+            canvas.coords(poly, p if p else (0, base, 0, base, 0, base))
 
     def _draw_wave(self, width: int, height: int):
-        # Anzahl horizontaler Punkte (= Pixelspalten)
-        num_points = max(50, min(600, int(width)))  # Performance-Schutz
+        line = self._viz_layout(('wave', width, height),
+                                lambda: self.viz_canvas.create_line(0, 0, 0, 0, fill='#1abc9c', width=2, smooth=True))
+        # Anzahl horizontaler Punkte: etwa jede zweite Pixelspalte, die Spline-Glättung
+        # der Linie (smooth=True) verdeckt den Unterschied
+        num_points = max(64, min(240, int(width) // 2))  # Performance-Schutz
         if self.analyzer and AUDIO_ANALYSIS_AVAILABLE and self.analyzer.is_active:
+            if self._viz_unchanged(self.analyzer.block_id):
+                return
             # ~120 ms Historie holen -> geringe Latenz, aber genügend Kontur
             want_secs = 0.12
-            want_samples = int(self.analyzer.sample_rate * want_secs)
+            want_samples = int(self.analyzer.wave_rate * want_secs)
             samples = self.analyzer.get_recent_wave(want_samples)
 
-            if samples.size < 4:
-                samples = np.zeros(num_points, dtype=np.float32)
-
-            # DC-Offset entfernen
-            samples = samples - np.mean(samples) if samples.size else samples
-
-            # Auf num_points resamplen (lineare Interpolation, schnell & stabil)
+            # Auf num_points resamplen (kubisch nach Hermite bzw. linear)
             if samples.size != num_points:
-                idx = np.linspace(0, max(1, samples.size - 1), num_points, dtype=np.float32)
-                i0 = np.floor(idx).astype(int)
-                i1 = np.minimum(i0 + 1, samples.size - 1)
-                w = idx - i0
-                wave = (1.0 - w) * samples[i0] + w * samples[i1]
+                key = (self.wave_interp_mode, samples.size, num_points)
+                if key != self.wave_interp_key:
+                    self._plan_wave_resample(samples.size, num_points)
+                    self.wave_interp_key = key
+                if self.wave_interp_mode == 'hermite':
+                    # Alle 4 Stützstellen in einen festen Puffer sammeln, gewichten, aufsummieren
+                    gather = self.wave_gather
+                    np.take(samples, self.wave_taps, out=gather)
+                    gather *= self.wave_weights
+                    wave = gather.sum(axis=0, out=self.wave_out)
+                else:
+                    wave = np.interp(self.wave_idx, self.wave_xp, samples)
             else:
                 wave = samples
 
-            # Dynamik skalieren (robust gegen Ausreißer)
-            peak = np.max(np.abs(wave)) if wave.size else 0.0
+            # DC-Offset und Dynamik aus Min/Max der Kurve: Mitte des Wertebereichs statt
+            # Mittelwert (kein extra Durchlauf über samples, Kurve nutzt die Höhe symmetrisch)
+            hi = float(wave.max())
+            lo = float(wave.min())
+            dc = 0.5 * (hi + lo)
+            peak = 0.5 * (hi - lo)
             scale = (height * 0.40) / peak if peak > 1e-6 else height * 0.05
 
-            mid = height // 2
-            pts = []
-            for i in range(num_points):
-                x = (width / (num_points - 1)) * i
-                y = mid - wave[i] * scale
-                pts.extend([x, y])
+            # x/y-Paare als flache Liste für Tk: x steht fest im Puffer, nur y neu schreiben
+            key = (num_points, width)
+            if key != self.wave_pts_key:
+                self.wave_pts = np.empty(2 * num_points, dtype=np.float32)
+                self.wave_pts[0::2] = np.linspace(0.0, float(width), num_points, dtype=np.float32)
+                self.wave_pts_key = key
+            ys = self.wave_pts[1::2]
+            # y = mid - (wave - dc) * scale
+            np.multiply(wave, -scale, out=ys, casting='unsafe')
+            ys += height // 2 + dc * scale
+            pts = self.wave_pts.tolist()
 
             if len(pts) >= 4:
-                self.viz_canvas.create_line(pts, fill='#1abc9c', width=2, smooth=True)
+                self.viz_canvas.coords(line, pts)
 
         else:
             # Fallback: leichte Sinusbewegung
@@ -1135,10 +1616,34 @@ class AudioPlayerApp(ctk.CTk):
             for i in range(n):
                 x = (width / n) * i
                 amp = 8
-                y = height // 2 + math.sin((i * 0.3) + (self.animation_tick * 0.1)) * amp
+                y = height // 2 + _sin_lut((i * 0.3) + (self.animation_tick * 0.1)) * amp
                 pts.extend([x, y])
             if len(pts) >= 4:
-                self.viz_canvas.create_line(pts, fill='#1abc9c', width=2, smooth=True)
+                self.viz_canvas.coords(line, pts)
+
+    def _plan_wave_resample(self, n_in: int, n_out: int):
+        """Positionen (und für Hermite Indizes + Gewichte) für n_in -> n_out Samples vorberechnen."""
+        idx = np.linspace(0, max(1, n_in - 1), n_out, dtype=np.float32)
+        self.wave_idx = idx
+        self.wave_xp = np.arange(n_in, dtype=np.float32)
+        if self.wave_interp_mode != 'hermite':
+            return
+        i0 = np.minimum(idx.astype(np.intp), n_in - 1)
+        f = idx - i0
+        f2 = f * f
+        f3 = f2 * f
+        # Ränder: Endpunkt wiederholen statt Verzögerung einzuführen
+        self.wave_taps = np.clip(np.stack((i0 - 1, i0, i0 + 1, i0 + 2)), 0, n_in - 1)
+        # Catmull-Rom-Gewichte von y[-1], y[0], y[1], y[2] (Summe = 1, Polynom
+        # ((c3*f + c2)*f + c1)*f + c0 nach den Samples ausmultipliziert)
+        self.wave_weights = np.stack((
+            -0.5 * f3 + f2 - 0.5 * f,
+            1.5 * f3 - 2.5 * f2 + 1.0,
+            -1.5 * f3 + 2.0 * f2 + 0.5 * f,
+            0.5 * f3 - 0.5 * f2,
+        )).astype(np.float32)
+        self.wave_gather = np.empty((4, n_out), dtype=np.float32)
+        self.wave_out = np.empty(n_out, dtype=np.float32)
 
     # ---------- Window ----------
     def _toggle_fullscreen(self):
@@ -1146,12 +1651,17 @@ class AudioPlayerApp(ctk.CTk):
         self.attributes('-fullscreen', self.fullscreen)
 
     def _quit(self):
+        # Noch ausstehende Favoriten-Änderung sofort speichern
+        if self.fav_job is not None:
+            self.after_cancel(self.fav_job)
+        self._flush_favorites()
         try:
             self.player.stop()
             if hasattr(self, 'equalizer') and self.equalizer:
                 vlc.libvlc_audio_equalizer_release(self.equalizer)
             if self.analyzer:
                 self.analyzer.stop()
+            self.io_pool.shutdown(wait=False)
         except Exception:
             pass
         # Loopback zurückbauen
@@ -1164,8 +1674,29 @@ class AudioPlayerApp(ctk.CTk):
 
     # ---------- Helpers ----------
     @staticmethod
-    def _probe_length(path: str) -> float:
+    def _scan_audio(folder_path: str) -> list[str]:
+        """Audiodateien eines Ordners (nicht rekursiv), nach Namen sortiert."""
+        # scandir liefert den Dateityp ohne extra stat(); Endung zuerst prüfen
+        with os.scandir(folder_path) as it:
+            files = [e.path for e in it if e.name.lower().endswith(AUDIO_EXT) and e.is_file()]
+        # Gleicher Ordner-Präfix: Pfade sortieren wie Dateinamen, ohne key-Funktion
+        files.sort()
+        return files
+
+    def _probe_length(self, path: str) -> float:
         try:
+            st = os.stat(path)
+        except OSError:
+            return 0.0
+        # Geänderte Datei (mtime/Größe) ergibt einen neuen Schlüssel -> wird neu gelesen
+        return self._probe_length_cached(path, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _probe_length_cached(path: str, _mtime_ns: int, _size: int) -> float:
+        try:
+            # mutagen erst beim ersten Song importieren (spürbar beim Kaltstart auf dem Pi)
+            from mutagen import File as MutagenFile
             audio = MutagenFile(path)
             if audio and hasattr(audio.info, 'length'):
                 return float(audio.info.length)
@@ -1175,8 +1706,13 @@ class AudioPlayerApp(ctk.CTk):
 
     @staticmethod
     def _fmt_time(seconds: float) -> str:
-        m = int(seconds // 60)
-        s = int(seconds % 60)
+        return AudioPlayerApp._fmt_seconds(int(seconds))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _fmt_seconds(sec: int) -> str:
+        # Bereits erzeugte Zeit-Strings wiederverwenden
+        m, s = divmod(sec, 60)
         return f"{m}:{s:02d}"
 
 
@@ -31,11 +31,52 @@ import tkinter as tk
 from tkinter import ttk
 import vlc
 import os
+import json
 from pathlib import Path
 from mutagen import File as MutagenFile
+from mutagen.mp3 import MP3
+from mutagen.flac import FLAC
+from mutagen.oggvorbis import OggVorbis
+from mutagen.mp4 import MP4
+from mutagen.aac import AAC
 import time
 import math
 import argparse
+import itertools
+import threading
+import concurrent.futures
+
+AUDIO_EXTENSIONS = frozenset(('mp3', 'wav', 'ogg', 'flac', 'm4a', 'aac', 'wma'))  # ohne Punkt, siehe has_audio_ext
+# Bekannte Formate direkt parsen, MutagenFile (Format-Erkennung) nur für den Rest
+LENGTH_PARSERS = {'mp3': MP3, 'flac': FLAC, 'ogg': OggVorbis, 'm4a': MP4, 'aac': AAC}
+try:
+    from mutagen.wave import WAVE  # erst ab mutagen 1.43, ältere Distro-Pakete: MutagenFile
+    LENGTH_PARSERS['wav'] = WAVE
+except ImportError:
+    pass
+# Song-Längen über Programmstarts hinweg merken: Pfad -> [mtime_ns, Größe, Länge]
+# (gleiches Cache-Verzeichnis wie rpi_audioplayer1.py, eigene Datei wegen mtime_ns)
+DURATION_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'rpi_audioplayer', 'durations.json')
+DURATION_SAVE_EVERY = 50  # Nach so vielen neuen Einträgen zwischendurch speichern (Kiosk wird oft hart ausgeschaltet)
+PLAYLIST_BATCH = 32  # Einträge pro Scan-/Einfüge-Schritt, dazwischen bearbeitet Tk Events
+
+# Wellen-Animation: eine volle Sinusperiode vorberechnet (Schritt 2π/628 ≈ 0.01 rad)
+WAVE_LUT_SIZE = 628
+WAVE_BAR_STEP = 30    # ≈ 0.3 rad Phasenversatz je Balken
+WAVE_FRAME_STEP = 7   # ≈ 0.07 rad je Frame, bei 30 fps so schnell wie früher 0.1 rad bei 20 fps
+ANIM_INTERVAL = 33    # ms zwischen zwei Animations-Frames (≈ 30 fps)
+WAVE_LUT = [math.sin(2 * math.pi * k / WAVE_LUT_SIZE) * 0.5 + 0.5 for k in range(WAVE_LUT_SIZE)]
+WAVE_HALF_HEIGHTS = [(5 + w * 25) / 2 for w in WAVE_LUT]
+# Rotanteil 155..255 ergibt nur 101 Farben: einmal formatieren, die Tabelle verweist darauf
+WAVE_PALETTE = [f'#{r:02x}{180:02x}{200:02x}' for r in range(155, 256)]  # grün -> blau
+WAVE_COLORS = [WAVE_PALETTE[int(w * 100 + 155) - 155] for w in WAVE_LUT]
+
+
+def has_audio_ext(name):
+    """Prüft die Endung ohne splitext-Tupel, lower() nur auf die paar Zeichen der Endung"""
+    _, dot, suffix = name.rpartition('.')
+    return bool(dot) and len(suffix) <= 4 and suffix.lower() in AUDIO_EXTENSIONS
+
 
 class AudioPlayer:
     def __init__(self, root, args=None):
@@ -58,7 +99,9 @@ class AudioPlayer:
             })
         
         # Variablen
-        self.playlist = []
+        self.playlist = []  # Pfade; basenames/lengths sind parallele Listen mit gleichem Index
+        self.basenames = []
+        self.lengths = []  # 0 = noch unbekannt
         self.current_index = 0
         self.is_playing = False
         self.volume = args.volume
@@ -66,9 +109,33 @@ class AudioPlayer:
         self.song_length = 0
         self.is_seeking = False
         self.animation_offset = 0
+        self.bar_ids = []  # Canvas-Items der Animation (einmal angelegt, danach nur verschoben)
+        self.pause_line_id = None
+        self.anim_width = 800  # Canvas-Breite, per <Configure> aktualisiert
+        self.anim_job = None  # after-ID der Animation (nur während der Wiedergabe)
+        self.window_visible = True  # Minimiert: Animation ruht
+        self.bar_layout_width = None  # Breite, für die bar_x berechnet wurde
+        self.bar_x = []  # (links, rechts) je Balken
+        self.bar_fills = []  # Zuletzt gesetzte Farbe je Balken
+        self.anim_playing = None  # Zuletzt gezeigter Zustand (Balken oder Linie)
         self.autoplay = args.autoplay
         self.fullscreen = True
-        self.update_in_progress = False
+        self.progress_job = None  # after-ID von update_progress (nur während der Wiedergabe)
+        self.last_shown_sec = -1  # Zuletzt angezeigte Sekunde
+        self.last_progress = -1  # Zuletzt gesetztes ganzes Prozent des Sliders
+        self.scan_token = 0  # Erhöht bei jedem load_folder; ältere Scans brechen ab
+        self.display_token = 0  # Dasselbe für den schrittweisen Aufbau der Listbox
+        self.marked_index = None  # Listbox-Zeile, die gerade das ▶ trägt
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # Tag-Parsing abseits von Tk
+        self.dur_cache = self.load_duration_cache()
+        self.dur_dirty = False
+        self.dur_new = 0  # Neue Einträge seit dem letzten Speichern
+        self.dur_lock = threading.Lock()  # Schützt dur_cache/dur_dirty/dur_new zwischen io_pool und quit_app
+        self.load_token = 0  # Verwirft Längen überholter load_song-Aufrufe
+        self.prefetch_job = None  # after-ID des Vorladens für den nächsten Song
+        self.length_job = None  # after-ID der Mutagen-Ersatzmessung, falls VLC keine Länge meldet
+        self.prefetch_path = None  # Vorgeladener Song (Pfad, da sich die Playlist ändern kann)
+        self.prefetch_media = None
         
         # Repeat-Modus aus args setzen
         repeat_modes = {'off': 0, 'all': 1, 'one': 2}
@@ -77,6 +144,9 @@ class AudioPlayer:
         # Equalizer-Werte (VLC unterstützt 10 Bänder)
         # Frequenzen: 60, 170, 310, 600, 1k, 3k, 6k, 12k, 14k, 16k Hz
         self.eq_bands = [0.0] * 10  # -20.0 bis +20.0 dB
+        self.debounce_ids = {}  # after-IDs der entprellten Slider-Aktionen
+        self.cfg_queue = {}  # Widget -> gesammelte configure-Optionen bis zum nächsten Idle
+        self.cfg_job = None
         
         # Vordefinierte Ordner (kannst du anpassen!)
         self.preset_folders = [
@@ -111,8 +181,8 @@ class AudioPlayer:
         # Ordner laden
         self.load_folder(self.music_folder)
         
-        # Loops starten
-        self.update_progress()
+        # Loops starten (Fortschritt läuft nur während der Wiedergabe)
+        self.start_progress()
         self.animate()
         
     def create_widgets(self):
@@ -128,6 +198,10 @@ class AudioPlayer:
             highlightthickness=0
         )
         self.animation_canvas.pack(fill=tk.X, pady=10)
+        # Breite nur bei Größenänderung übernehmen statt in jedem Frame abzufragen
+        self.animation_canvas.bind('<Configure>', self.on_canvas_resize)
+        self.root.bind('<Map>', self.on_map)
+        self.root.bind('<Unmap>', self.on_unmap)
         
         # Titel-Label
         self.title_label = tk.Label(
@@ -510,6 +584,8 @@ class AudioPlayer:
         self.root.bind('q', lambda e: self.quit_app())
         self.root.bind('Q', lambda e: self.quit_app())
         self.root.bind('<Escape>', lambda e: self.quit_app())
+        # Schließen über den Fenstermanager ebenfalls sauber beenden (Cache speichern)
+        self.root.protocol('WM_DELETE_WINDOW', self.quit_app)
     
     def setup_equalizer(self):
         """Initialisiert den VLC Equalizer"""
@@ -524,25 +600,69 @@ class AudioPlayer:
     
     def change_eq_band(self, band_index, value):
         """Ändert eine Equalizer-Band"""
+        value = float(value)
+        if value == self.eq_bands[band_index]:
+            return  # Slider meldet unveränderten Wert (z.B. nach set()), nichts an VLC schicken
         try:
             if self.equalizer:
                 # Wert von -20 bis +20 dB
                 vlc.libvlc_audio_equalizer_set_amp_at_index(
                     self.equalizer, 
-                    float(value), 
+                    value, 
                     band_index
                 )
-                # Equalizer neu setzen um Änderungen anzuwenden
-                vlc.libvlc_media_player_set_equalizer(self.player, self.equalizer)
-                self.eq_bands[band_index] = float(value)
+                # Equalizer neu setzen um Änderungen anzuwenden (einmal nach dem Ziehen)
+                self.debounce('eq', 30, lambda: vlc.libvlc_media_player_set_equalizer(self.player, self.equalizer))
+                self.eq_bands[band_index] = value
         except Exception as e:
             print(f"EQ-Band Fehler: {e}")
     
+    def cfg(self, widget, **kw):
+        """Merkt Widget-Änderungen vor, mehrere Aufrufe im selben Durchlauf ergeben ein configure"""
+        pending = self.cfg_queue.get(widget)
+        if pending is None:
+            self.cfg_queue[widget] = kw
+        else:
+            pending.update(kw)
+        if self.cfg_job is None:
+            self.cfg_job = self.root.after_idle(self.flush_cfg)
+    
+    def flush_cfg(self):
+        """Schreibt alle vorgemerkten Widget-Änderungen"""
+        queue, self.cfg_queue = self.cfg_queue, {}
+        self.cfg_job = None
+        for widget, kw in queue.items():
+            widget.configure(**kw)
+    
+    def debounce(self, key, ms, fn):
+        """Führt fn erst aus, wenn key für ms Millisekunden nicht erneut ausgelöst wurde"""
+        job = self.debounce_ids.get(key)
+        if job:
+            self.root.after_cancel(job)
+        self.debounce_ids[key] = self.root.after(ms, self.run_debounced, key, fn)
+    
+    def run_debounced(self, key, fn):
+        """Führt eine entprellte Aktion aus"""
+        self.debounce_ids.pop(key, None)
+        fn()
+    
     def apply_eq_preset(self, values):
-        """Wendet ein EQ-Preset an"""
-        for i, val in enumerate(values):
-            self.eq_sliders[i].set(val)
-            self.change_eq_band(i, val)
+        """Wendet ein EQ-Preset an (alle Bänder schreiben, einmal anbinden)"""
+        try:
+            for i, val in enumerate(values):
+                val = float(val)
+                if self.equalizer:
+                    vlc.libvlc_audio_equalizer_set_amp_at_index(self.equalizer, val, i)
+                # Erst den Wert merken: der Slider-Callback sieht ihn dann als unverändert an
+                self.eq_bands[i] = val
+                self.eq_sliders[i].set(val)
+            if self.equalizer:
+                job = self.debounce_ids.pop('eq', None)
+                if job:
+                    self.root.after_cancel(job)
+                vlc.libvlc_media_player_set_equalizer(self.player, self.equalizer)
+        except Exception as e:
+            print(f"EQ-Preset Fehler: {e}")
     
     def toggle_fullscreen(self):
         """Wechselt zwischen Fullscreen und Fenster-Modus"""
@@ -568,57 +688,84 @@ class AudioPlayer:
         self.music_folder = folder
         self.load_folder(folder)
     
+    def on_canvas_resize(self, event):
+        """Merkt sich die aktuelle Breite des Animations-Canvas"""
+        if event.width > 1:
+            self.anim_width = event.width
+    
+    def on_map(self, event):
+        """Fenster wieder sichtbar: Animation fortsetzen"""
+        if event.widget is self.root:
+            self.window_visible = True
+            self.start_animation()
+    
+    def on_unmap(self, event):
+        """Fenster minimiert: Animation anhalten"""
+        if event.widget is self.root:
+            self.window_visible = False
+            if self.anim_job is not None:
+                self.root.after_cancel(self.anim_job)
+                self.anim_job = None
+    
+    def start_animation(self):
+        """Zeichnet sofort neu (Balken oder Pause-Linie), animate plant selbst weiter"""
+        if self.anim_job is not None:
+            self.root.after_cancel(self.anim_job)
+            self.anim_job = None
+        self.animate()
+    
     def animate(self):
         """Animiert Wellenlinien beim Abspielen"""
-        self.animation_canvas.delete("all")
+        self.anim_job = None
+        canvas = self.animation_canvas
+        num_bars = 40
+        height = 60
+        center_y = height // 2
         
-        if self.is_playing:
-            width = self.animation_canvas.winfo_width()
-            if width <= 1:
-                width = 800  # Fallback
-            
-            height = 60
-            center_y = height // 2
-            
-            # Mehrere Wellenlinien zeichnen
-            num_bars = 40
+        # Items nur einmal anlegen, danach per coords/itemconfigure aktualisieren
+        if not self.bar_ids:
+            self.bar_ids = [canvas.create_rectangle(0, 0, 0, 0, outline='') for _ in range(num_bars)]
+            self.bar_fills = [None] * num_bars
+            self.pause_line_id = canvas.create_line(0, 0, 0, 0, fill='#95a5a6', width=3)
+        
+        width = self.anim_width
+        
+        # Balkenpositionen nur bei Breitenänderung neu berechnen
+        if width != self.bar_layout_width:
             bar_width = width / num_bars
-            
-            for i in range(num_bars):
-                # Wellenförmige Animation
-                wave = math.sin((i * 0.3) + (self.animation_offset * 0.1)) * 0.5 + 0.5
-                bar_height = 5 + wave * 25
-                
-                x = i * bar_width + bar_width / 2
-                
-                # Farbverlauf von grün zu blau
-                color_value = int(wave * 100 + 155)
-                color = f'#{color_value:02x}{180:02x}{200:02x}'
+            self.bar_x = [(i * bar_width + bar_width / 2 - bar_width / 3,
+                           i * bar_width + bar_width / 2 + bar_width / 3) for i in range(num_bars)]
+            canvas.coords(self.pause_line_id, 50, 30, width - 50, 30)
+            self.bar_layout_width = width
+        
+        # Zwischen Balken und statischer Linie nur beim Zustandswechsel umschalten
+        if self.is_playing != self.anim_playing:
+            bars_state = tk.NORMAL if self.is_playing else tk.HIDDEN
+            for bar in self.bar_ids:
+                canvas.itemconfigure(bar, state=bars_state)
+            canvas.itemconfigure(self.pause_line_id, state=tk.HIDDEN if self.is_playing else tk.NORMAL)
+            self.anim_playing = self.is_playing
+        
+        if self.is_playing:
+            # Wellenförmige Animation: Höhe und Farbe aus den Tabellen statt math.sin je Balken
+            k = (self.animation_offset * WAVE_FRAME_STEP) % WAVE_LUT_SIZE
+            fills = self.bar_fills
+            for i, (bar, (x0, x1)) in enumerate(zip(self.bar_ids, self.bar_x)):
+                half = WAVE_HALF_HEIGHTS[k]
                 
-                # Balken zeichnen
-                self.animation_canvas.create_rectangle(
-                    x - bar_width / 3,
-                    center_y - bar_height / 2,
-                    x + bar_width / 3,
-                    center_y + bar_height / 2,
-                    fill=color,
-                    outline=''
-                )
+                # Balken verschieben statt neu zeichnen, Farbe nur bei Änderung setzen
+                canvas.coords(bar, x0, center_y - half, x1, center_y + half)
+                color = WAVE_COLORS[k]
+                if color is not fills[i]:
+                    canvas.itemconfigure(bar, fill=color)
+                    fills[i] = color
+                k = (k + WAVE_BAR_STEP) % WAVE_LUT_SIZE
             
             self.animation_offset += 1
-        else:
-            # Statische Linie wenn pausiert
-            width = self.animation_canvas.winfo_width()
-            if width <= 1:
-                width = 800
-            self.animation_canvas.create_line(
-                50, 30, width - 50, 30,
-                fill='#95a5a6',
-                width=3
-            )
         
-        # Animation wiederholen
-        self.root.after(50, self.animate)
+        # Animation nur beim Abspielen und sichtbarem Fenster wiederholen, sonst steht die Pause-Linie
+        if self.is_playing and self.window_visible:
+            self.anim_job = self.root.after(ANIM_INTERVAL, self.animate)
     
     def toggle_repeat(self):
         """Wechselt zwischen Repeat-Modi"""
@@ -628,16 +775,68 @@ class AudioPlayer:
     def update_repeat_button(self):
         """Aktualisiert den Repeat-Button basierend auf repeat_mode"""
         if self.repeat_mode == 0:
-            self.repeat_btn.config(text="🔁 AUS", bg='#95a5a6')
+            self.cfg(self.repeat_btn, text="🔁 AUS", bg='#95a5a6')
         elif self.repeat_mode == 1:
-            self.repeat_btn.config(text="🔁 ALLE", bg='#27ae60')
+            self.cfg(self.repeat_btn, text="🔁 ALLE", bg='#27ae60')
         else:  # 2
-            self.repeat_btn.config(text="🔂 EINS", bg='#f39c12')
+            self.cfg(self.repeat_btn, text="🔂 EINS", bg='#f39c12')
+    
+    def load_duration_cache(self):
+        """Lädt den Längen-Cache von der Platte"""
+        try:
+            with open(DURATION_CACHE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {}
+    
+    def save_duration_cache(self):
+        """Schreibt den Längen-Cache atomar, falls sich etwas geändert hat"""
+        with self.dur_lock:
+            if not self.dur_dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(DURATION_CACHE), exist_ok=True)
+                tmp = DURATION_CACHE + '.tmp'
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(dict(self.dur_cache), f, separators=(',', ':'))
+                os.replace(tmp, DURATION_CACHE)
+                self.dur_dirty = False
+                self.dur_new = 0
+            except OSError:
+                pass
     
     def get_song_length(self, filepath):
-        """Ermittelt die Länge des Songs in Sekunden"""
+        """Ermittelt die Länge des Songs in Sekunden (mit Cache)"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return 0
+        cached = self.dur_cache.get(filepath)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        length = self.parse_song_length(filepath)
+        if length:
+            # Unter dem Lock, damit save_duration_cache (auch aus quit_app) nie ein halb geändertes dict kopiert
+            with self.dur_lock:
+                self.dur_cache[filepath] = [st.st_mtime_ns, st.st_size, length]
+                self.dur_dirty = True
+                self.dur_new += 1
+                due = self.dur_new >= DURATION_SAVE_EVERY
+            if due:
+                self.save_duration_cache()  # läuft im io_pool, blockiert Tk nicht
+        return length
+    
+    def parse_song_length(self, filepath):
+        """Liest die Länge des Songs mit Mutagen aus der Datei"""
         try:
-            audio = MutagenFile(filepath)
+            parser = LENGTH_PARSERS.get(filepath.rpartition('.')[2].lower())
+            try:
+                audio = parser(filepath) if parser else MutagenFile(filepath)
+            except Exception:
+                audio = MutagenFile(filepath)  # Endung passt nicht zum Inhalt
             if audio and hasattr(audio.info, 'length'):
                 return audio.info.length
         except:
@@ -657,49 +856,112 @@ class AudioPlayer:
     def end_seek(self, event):
         """Beendet das Seeking und springt zur Position"""
         self.is_seeking = False
-        if self.song_length > 0:
-            position = (self.progress_var.get() / 100) * self.song_length
-            self.player.set_time(int(position * 1000))  # sekunden zu ms
+        # Relativ springen: VLC kennt die Länge selbst, Mutagen wird dafür nicht gebraucht
+        self.player.set_position(self.progress_var.get() / 100.0)
+        # Nächstes Update auf jeden Fall anzeigen
+        self.last_shown_sec = -1
+        self.last_progress = -1
     
     def on_progress_change(self, val):
         """Wird aufgerufen wenn der Progress-Slider bewegt wird"""
         if self.is_seeking and self.song_length > 0:
             current = (float(val) / 100) * self.song_length
-            self.current_time_label.config(text=self.format_time(current))
+            self.cfg(self.current_time_label, text=self.format_time(current))
+    
+    def start_progress(self):
+        """Startet die Fortschrittsanzeige, falls sie nicht schon läuft"""
+        if self.progress_job is None and self.is_playing:
+            self.update_progress()
+    
+    def stop_progress(self):
+        """Hält die Fortschrittsanzeige an (Pause)"""
+        if self.progress_job is not None:
+            self.root.after_cancel(self.progress_job)
+            self.progress_job = None
     
     def update_progress(self):
         """Aktualisiert die Fortschrittsanzeige"""
-        if self.is_playing and not self.is_seeking and self.song_length > 0 and not self.update_in_progress:
-            self.update_in_progress = True
+        self.progress_job = None
+        if not self.is_playing:
+            # Pausiert/gestoppt: nicht weiter abfragen, play_song startet neu
+            return
+        # Länge direkt bei VLC abfragen statt per MediaPlayerLengthChanged: dessen Callback
+        # läuft im VLC-Thread und dürfte Tk nicht aufrufen (set_media() wartet auf diesen Thread)
+        try:
+            length_ms = self.player.get_length()
+            if length_ms > 0:
+                self.apply_vlc_length(length_ms / 1000.0)
+        except Exception:
+            pass
+        # Läuft nur über den einen after-Timer im Tk-Thread, kann sich also nicht überschneiden
+        if not self.is_seeking and self.song_length > 0:
             try:
                 # VLC gibt Zeit in Millisekunden
                 pos_ms = self.player.get_time()
                 if pos_ms >= 0:
                     pos = pos_ms / 1000.0
                     if pos <= self.song_length:
+                        # Slider nur bei neuem ganzen Prozent, Label nur bei neuer Sekunde
                         progress = (pos / self.song_length) * 100
-                        self.progress_var.set(progress)
-                        self.current_time_label.config(text=self.format_time(pos))
+                        if int(progress) != self.last_progress:
+                            self.last_progress = int(progress)
+                            self.progress_var.set(progress)
+                        if int(pos) != self.last_shown_sec:
+                            self.last_shown_sec = int(pos)
+                            self.cfg(self.current_time_label, text=self.format_time(pos))
             except:
                 pass
-            finally:
-                self.update_in_progress = False
         
-        self.root.after(500, self.update_progress)
+        self.progress_job = self.root.after(500, self.update_progress)
     
     def load_folder(self, folder_path):
         """Lädt alle Audio-Dateien aus dem Ordner"""
         if not os.path.exists(folder_path):
-            self.title_label.config(text=f"Ordner nicht gefunden: {folder_path}")
+            self.cfg(self.title_label, text=f"Ordner nicht gefunden: {folder_path}")
             return
         
         self.playlist = []
-        audio_extensions = ('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac', '.wma')
+        self.basenames = []
+        self.lengths = []
+        # Neuer Ordner: noch laufenden Scan des alten Ordners abbrechen
+        self.scan_token += 1
+        # Ebenso Vorladen und Längenabfragen, die sich auf die alte Playlist beziehen
+        self.load_token += 1
+        for job in (self.prefetch_job, self.length_job):
+            if job:
+                self.root.after_cancel(job)
+        self.prefetch_job = None
+        self.length_job = None
         
         try:
-            for file in sorted(os.listdir(folder_path)):
-                if file.lower().endswith(audio_extensions):
-                    self.playlist.append(os.path.join(folder_path, file))
+            it = os.scandir(folder_path)
+        except Exception as e:
+            self.cfg(self.title_label, text=f"Fehler beim Laden: {str(e)}")
+            return
+        self.cfg(self.title_label, text="Lade Ordner …")
+        self.scan_folder_step(self.scan_token, folder_path, it, [])
+    
+    def scan_folder_step(self, token, folder_path, it, names):
+        """Liest die nächsten PLAYLIST_BATCH Einträge, danach ist wieder Tk dran"""
+        if token != self.scan_token:
+            it.close()
+            return
+        try:
+            # Endung per Set prüfen (vor dem is_file-Test)
+            count = 0
+            for e in itertools.islice(it, PLAYLIST_BATCH):
+                count += 1
+                if has_audio_ext(e.name) and e.is_file():
+                    names.append(e.name)
+            if count == PLAYLIST_BATCH:
+                self.root.after_idle(self.scan_folder_step, token, folder_path, it, names)
+                return
+            it.close()
+            
+            names.sort()
+            self.basenames = names
+            self.playlist = [os.path.join(folder_path, name) for name in names]
+            self.lengths = [0] * len(names)
             
             if self.playlist:
                 self.current_index = 0
@@ -709,9 +971,11 @@ class AudioPlayer:
                 if self.autoplay:
                     self.play_song()
             else:
-                self.title_label.config(text="Keine Audiodateien gefunden")
+                self.update_playlist_display()
+                self.cfg(self.title_label, text="Keine Audiodateien gefunden")
         except Exception as e:
-            self.title_label.config(text=f"Fehler beim Laden: {str(e)}")
+            it.close()
+            self.cfg(self.title_label, text=f"Fehler beim Laden: {str(e)}")
     
     def load_folder_button(self):
         """Lädt Ordner über Button"""
@@ -720,56 +984,179 @@ class AudioPlayer:
         self.load_folder(folder)
     
     def update_playlist_display(self):
-        """Aktualisiert die Playlist-Anzeige"""
+        """Aktualisiert die Playlist-Anzeige (schrittweise, blockiert Tk nicht)"""
+        self.display_token += 1
+        self.marked_index = None
         self.playlist_box.delete(0, tk.END)
-        for i, song in enumerate(self.playlist):
-            filename = os.path.basename(song)
-            prefix = "▶ " if i == self.current_index else "   "
-            self.playlist_box.insert(tk.END, f"{prefix}{filename}")
+        self.append_playlist_batch(self.display_token, 0)
+    
+    def playlist_row(self, index):
+        """Text einer Playlist-Zeile, mit ▶ für den aktuellen Song"""
+        prefix = "▶ " if index == self.current_index else "   "
+        return f"{prefix}{self.basenames[index]}"
+    
+    def set_marker(self, index):
+        """Verschiebt das ▶ auf index, nur die beiden betroffenen Zeilen werden neu geschrieben"""
+        size = self.playlist_box.size()
+        old = self.marked_index
+        if old is not None and old != index and old < size:
+            self.playlist_box.delete(old)
+            self.playlist_box.insert(old, self.playlist_row(old))
+        if index < size:
+            if old != index:
+                self.playlist_box.delete(index)
+                self.playlist_box.insert(index, self.playlist_row(index))
+            self.marked_index = index
+            self.playlist_box.selection_clear(0, tk.END)
+            self.playlist_box.selection_set(index)
+            self.playlist_box.see(index)
+        else:
+            self.marked_index = None  # Zeile fehlt noch, append_playlist_batch markiert sie
+    
+    def append_playlist_batch(self, token, start):
+        """Fügt die nächsten PLAYLIST_BATCH Zeilen mit einem insert-Aufruf ein"""
+        if token != self.display_token:
+            return
+        end = min(start + PLAYLIST_BATCH, len(self.playlist))
+        rows = [self.playlist_row(i) for i in range(start, end)]
+        if rows:
+            self.playlist_box.insert(tk.END, *rows)
         
-        if self.playlist:
+        if start <= self.current_index < end:
+            self.marked_index = self.current_index
             self.playlist_box.selection_clear(0, tk.END)
             self.playlist_box.selection_set(self.current_index)
             self.playlist_box.see(self.current_index)
+        if end < len(self.playlist):
+            self.root.after_idle(self.append_playlist_batch, token, end)
     
     def load_song(self, index):
         """Lädt einen Song"""
         if 0 <= index < len(self.playlist):
             try:
                 filepath = self.playlist[index]
+                if self.prefetch_job:
+                    self.root.after_cancel(self.prefetch_job)
+                    self.prefetch_job = None
+                if self.length_job:
+                    self.root.after_cancel(self.length_job)
+                    self.length_job = None
                 
-                # VLC Media erstellen und laden
-                media = self.vlc_instance.media_new(filepath)
+                # VLC Media erstellen und laden (vorgeladenes Media wiederverwenden)
+                prefetched = self.prefetch_path == filepath
+                if prefetched:
+                    media = self.prefetch_media
+                else:
+                    media = self.vlc_instance.media_new(filepath)
+                self.prefetch_path = None
+                self.prefetch_media = None
                 self.player.set_media(media)
                 
-                filename = os.path.basename(filepath)
-                self.title_label.config(text=filename)
+                self.cfg(self.title_label, text=self.basenames[index])
                 self.current_index = index
-                self.update_playlist_display()
+                self.set_marker(index)
                 
-                # Song-Länge ermitteln
-                self.song_length = self.get_song_length(filepath)
-                self.total_time_label.config(text=self.format_time(self.song_length))
-                self.current_time_label.config(text="0:00")
+                # Song-Länge: bekannt, sonst meldet VLC sie beim Abspielen (Mutagen nur als Ersatz)
+                self.load_token += 1
+                token = self.load_token
+                if self.lengths[index]:
+                    self.song_length = self.lengths[index]
+                    self.cfg(self.total_time_label, text=self.format_time(self.song_length))
+                else:
+                    self.song_length = 0
+                    self.cfg(self.total_time_label, text="--:--")
+                    self.length_job = self.root.after(1500, self.probe_length, token, index, filepath)
+                self.cfg(self.current_time_label, text="0:00")
                 self.progress_var.set(0)
+                self.last_shown_sec = 0
+                self.last_progress = 0
+                
+                # Nächsten Song vorladen, während dieser spielt
+                self.prefetch_job = self.root.after(2000, self.prefetch, token, (index + 1) % len(self.playlist))
                 
             except Exception as e:
-                self.title_label.config(text=f"Fehler: {str(e)}")
+                self.cfg(self.title_label, text=f"Fehler: {str(e)}")
+    
+    def store_length(self, index, filepath, length):
+        """Merkt sich eine Song-Länge, sofern die Playlist noch dieselbe ist"""
+        if index < len(self.playlist) and self.playlist[index] == filepath:
+            self.lengths[index] = length
+    
+    def probe_length(self, token, index, filepath):
+        """Ersatz: VLC hat noch keine Länge gemeldet (z.B. nicht gestartet), Mutagen fragen"""
+        self.length_job = None
+        if token != self.load_token or self.song_length > 0:
+            return
+        future = self.io_pool.submit(self.get_song_length, filepath)
+        future.add_done_callback(lambda f: self.root.after(0, self.apply_length, token, index, filepath, f))
+    
+    def apply_length(self, token, index, filepath, future):
+        """Übernimmt die im Hintergrund ermittelte Song-Länge (im Tk-Thread)"""
+        length = future.result()
+        self.store_length(index, filepath, length)
+        if token != self.load_token:
+            return  # Inzwischen wurde ein anderer Song geladen
+        if self.song_length > 0 or length <= 0:
+            return  # VLC war schneller (und genauer) oder Mutagen kennt die Länge nicht
+        self.song_length = length
+        self.cfg(self.total_time_label, text=self.format_time(self.song_length))
+        self.last_shown_sec = -1
+        self.last_progress = -1
+    
+    def apply_vlc_length(self, length):
+        """Übernimmt die von VLC gemeldete Länge (aus update_progress, im Tk-Thread)"""
+        if length == self.song_length:
+            return
+        if self.current_index < len(self.playlist):
+            self.lengths[self.current_index] = length
+        self.song_length = length
+        self.cfg(self.total_time_label, text=self.format_time(length))
+        self.last_shown_sec = -1
+        self.last_progress = -1
+    
+    def prefetch(self, token, index):
+        """Ermittelt die Länge des nächsten Songs im Hintergrund"""
+        self.prefetch_job = None
+        if token != self.load_token or index >= len(self.playlist):
+            return  # Playlist wurde inzwischen ersetzt
+        filepath = self.playlist[index]
+        if self.lengths[index]:
+            self.apply_prefetch(token, index, filepath, None)  # Länge schon bekannt, nur Media anlegen
+            return
+        future = self.io_pool.submit(self.get_song_length, filepath)
+        future.add_done_callback(lambda f: self.root.after(0, self.apply_prefetch, token, index, filepath, f))
+    
+    def apply_prefetch(self, token, index, filepath, future):
+        """Legt Media und Länge des nächsten Songs bereit (im Tk-Thread)"""
+        if future is not None:
+            self.store_length(index, filepath, future.result())
+        if token != self.load_token:
+            return  # Inzwischen wurde ein anderer Song geladen
+        try:
+            self.prefetch_media = self.vlc_instance.media_new(filepath)
+            self.prefetch_path = filepath
+        except Exception:
+            self.prefetch_path = None
+            self.prefetch_media = None
     
     def play_song(self):
         """Startet die Wiedergabe"""
         try:
             self.player.play()
             self.is_playing = True
-            self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
+            self.cfg(self.play_btn, text="⏸ PAUSE", bg='#e67e22')
+            self.start_progress()
+            self.start_animation()
         except Exception as e:
-            self.title_label.config(text=f"Wiedergabefehler: {str(e)}")
+            self.cfg(self.title_label, text=f"Wiedergabefehler: {str(e)}")
     
     def pause_song(self):
         """Pausiert die Wiedergabe"""
         self.player.pause()
         self.is_playing = False
-        self.play_btn.config(text="▶ PLAY", bg='#27ae60')
+        self.cfg(self.play_btn, text="▶ PLAY", bg='#27ae60')
+        self.stop_progress()
+        self.start_animation()  # Pause-Linie einmal zeichnen, dann ruht die Animation
     
     def toggle_play(self):
         """Wechselt zwischen Play und Pause"""
@@ -779,50 +1166,48 @@ class AudioPlayer:
             if self.player.get_state() == vlc.State.Paused:
                 self.player.play()
                 self.is_playing = True
-                self.play_btn.config(text="⏸ PAUSE", bg='#e67e22')
+                self.cfg(self.play_btn, text="⏸ PAUSE", bg='#e67e22')
+                self.start_progress()
+                self.start_animation()
             else:
                 self.play_song()
     
+    def goto(self, index, force_play=False):
+        """Lädt den Song und spielt ihn, falls gerade gespielt wird (oder force_play)"""
+        self.load_song(index)
+        if force_play or self.is_playing:
+            self.play_song()
+    
     def next_song(self):
         """Nächster Song"""
         if self.playlist:
             if self.repeat_mode == 2:  # Repeat One
                 # Gleichen Song neu starten
-                self.load_song(self.current_index)
+                self.goto(self.current_index)
             else:
-                self.current_index = (self.current_index + 1) % len(self.playlist)
-                self.load_song(self.current_index)
-            
-            if self.is_playing or True:  # Autoplay
-                self.play_song()
+                self.goto((self.current_index + 1) % len(self.playlist))
     
     def previous_song(self):
         """Vorheriger Song"""
         if self.playlist:
-            self.current_index = (self.current_index - 1) % len(self.playlist)
-            self.load_song(self.current_index)
-            if self.is_playing:
-                self.play_song()
+            self.goto((self.current_index - 1) % len(self.playlist))
     
     def change_volume(self, val):
         """Ändert die Lautstärke"""
         self.volume = int(val)
-        self.player.audio_set_volume(self.volume)
+        # Beim Ziehen feuert der Slider pro Pixel, VLC nur einmal am Ende aufrufen
+        self.debounce('vol', 30, lambda: self.player.audio_set_volume(self.volume))
     
     def on_playlist_select(self, event):
         """Song aus Playlist auswählen"""
         selection = self.playlist_box.curselection()
         if selection:
-            index = selection[0]
-            self.load_song(index)
-            if self.is_playing:
-                self.play_song()
+            self.goto(selection[0])
     
     def on_song_end(self, event):
         """Wird aufgerufen wenn ein Song zu Ende ist"""
         if self.repeat_mode == 2:  # Repeat One
-            self.root.after(100, lambda: self.load_song(self.current_index))
-            self.root.after(200, self.play_song)
+            self.root.after(100, lambda: self.goto(self.current_index, force_play=True))
         elif self.repeat_mode == 1:  # Repeat All
             self.root.after(100, self.next_song)
         elif self.repeat_mode == 0:  # Kein Repeat
@@ -830,8 +1215,14 @@ class AudioPlayer:
             if self.current_index < len(self.playlist) - 1:
                 self.root.after(100, self.next_song)
             else:
-                self.is_playing = False
-                self.play_btn.config(text="▶ PLAY", bg='#27ae60')
+                self.root.after(0, self.playlist_finished)
+    
+    def playlist_finished(self):
+        """Letzter Song ohne Repeat zu Ende (im Tk-Thread)"""
+        self.is_playing = False
+        self.cfg(self.play_btn, text="▶ PLAY", bg='#27ae60')
+        self.stop_progress()
+        self.start_animation()
     
     def quit_app(self):
         """Beendet die Anwendung sauber"""
@@ -839,6 +1230,8 @@ class AudioPlayer:
             self.player.stop()
             if hasattr(self, 'equalizer') and self.equalizer:
                 vlc.libvlc_audio_equalizer_release(self.equalizer)
+            self.io_pool.shutdown(wait=False)
+            self.save_duration_cache()
         except:
             pass
         self.root.quit()